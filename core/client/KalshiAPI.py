@@ -1,13 +1,37 @@
 from .KalshiAuthentication import KalshiAuthentication
-from typing import List
+from .OrderBatcher import OrderBatcher, BatcherConfig
+from typing import List, AsyncIterator
 import httpx
-from json import JSONDecodeError
+import orjson
 import logging
 import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from live_trading.RiskExceptions import *
 
 logger = logging.getLogger("ks_rest")
 
+# Static endpoint paths
+_ORDERS_PATH = '/trade-api/v2/portfolio/orders'
+_BATCHED_ORDERS_PATH = '/trade-api/v2/portfolio/orders/batched'
+_POSITIONS_PATH = '/trade-api/v2/portfolio/positions'
+_BALANCE_PATH = '/trade-api/v2/portfolio/balance'
+_USER_DATA_TIMESTAMP_PATH = '/trade-api/v2/exchange/user_data_timestamp'
+
+@lru_cache(maxsize=256)
+def _orderbook_path(ticker: str) -> str:
+    return f'/trade-api/v2/markets/{ticker}/orderbook'
+
+@lru_cache(maxsize=256)
+def _market_path(ticker: str) -> str:
+    return f'/trade-api/v2/markets/{ticker}'
+
+@lru_cache(maxsize=256)
+def _event_path(event_ticker: str) -> str:
+    return f'/trade-api/v2/events/{event_ticker}'
+
 class APIError(Exception):
     pass
 
@@ -17,6 +41,12 @@ class RateLimitError(Exception):
 class AuthError(Exception):
     pass
 
+class _LeaderCancelled(Exception):
+    '''
+    Set on a shared GET future when the request that owns it is
+    cancelled, so waiting requests re-issue it instead of failing.
+    '''
+
 class KalshiAPI:
     '''
     Async (httpx) class for Kalshi's REST API with retry logic.
@@ -24,86 +54,209 @@ class KalshiAPI:
     All methods return JSON obj of response with no type or
     response validation.
     '''
-    def __init__(self, session: KalshiAuthentication, max_retries: int = 3, retry_delay: float = .1, time_out: int = 5):
+    def __init__(self, session: KalshiAuthentication, max_retries: int = 3, retry_delay: float = .1, retry_cap: float = 5.0,
+                 time_out: int = 5,
+                 max_keepalive_connections: int = 8, max_connections: int = 8, keepalive_expiry: float = 30.0,
+                 http2: bool = True, max_concurrency: int = 16, batcher_config: BatcherConfig | None = None):
         self.session = session
         self.base_url = "https://api.elections.kalshi.com"
         self.client = None
 
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.retry_cap = retry_cap
         self.time_out = time_out
 
+        # Connection pool parameters
+        self.max_keepalive_connections = max_keepalive_connections
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+
+        # Bounds in-flight requests, created on connect to bind to the running loop
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+
+        # [(path, params), (monotonic_ts, response)] cache for idempotent GETs
+        self._cache = {}
+
+        # [(path, params), Future] map of in-flight GET requests
+        self._inflight = {}
+
+        # (monotonic_ts, [ticker, position]) index of all market positions
+        self._position_map = None
+
+        # Batching gates for single-order submission
+        self._order_batcher = OrderBatcher(self.batch_create_orders, batcher_config)
+        self._cancel_batcher = OrderBatcher(self.batch_cancel_orders, batcher_config)
+
     async def connect(self):
         '''
-        Init the client if applicable
+        Init the client if applicable.
+
+        A single pooled client is kept for the lifetime of the
+        connection so TCP and TLS handshakes are amortized across
+        requests. HTTP/2 multiplexes concurrent requests over a
+        single connection, so the pool is kept small.
+
+        No loop-specific code is used; the runners start the event
+        loop on uvloop (winloop on Windows) when it is installed.
         '''
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
         if self.client is None:
-            self.client = httpx.AsyncClient()
+            self.client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    max_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                ),
+                headers={
+                    'Connection': 'keep-alive',
+                    'KALSHI-ACCESS-KEY': self.session.access_key
+                },
+                timeout=self.time_out
+            )
 
     async def close(self):
         '''
         Close the client if applicable
         '''
+        await self._order_batcher.close()
+        await self._cancel_batcher.close()
+
         if self.client:
             await self.client.aclose()
             self.client = None
 
-    def _gen_headers(self, method: str, path: str) -> dict:
+    def _backoff_delay(self, attempt: int) -> float:
+        '''
+        Returns a full-jitter exponential backoff delay for attempt,
+        capped at retry_cap, to avoid synchronized retries.
+        '''
+        return random.uniform(0, min(self.retry_cap, self.retry_delay * (2 ** attempt)))
+
+    def _rate_limit_delay(self, response: httpx.Response, attempt: int) -> float:
         '''
-        Generates signature and timestamp string for request authentication. Formats into Kalshi
-        API header format.
-        Returns headers.
+        Returns the delay, in seconds, requested by a rate-limited response.
+        Reads Retry-After (seconds or HTTP-date), then x-ratelimit-reset
+        (POSIX seconds), and falls back to jittered backoff.
         '''
-        timestampt_str = self.session.gen_timestampstr()
+        delay = None
 
-        path_without_query = path.split('?')[0]
-        msg_string = timestampt_str + method + path_without_query
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
 
-        sig = self.session.sign_pss_text(msg_string)
+        if delay is None and (reset := response.headers.get("x-ratelimit-reset")) is not None:
+            try:
+                delay = float(reset) - time.time()
+            except ValueError:
+                delay = None
 
-        headers = {
-            'KALSHI-ACCESS-KEY': self.session.access_key,
-            'KALSHI-ACCESS-SIGNATURE': sig,
-            'KALSHI-ACCESS-TIMESTAMP': timestampt_str
-        }
+        if delay is None:
+            return self._backoff_delay(attempt)
 
-        return headers
+        delay = max(0.0, delay)
+        return delay + random.uniform(0, .25 * delay)
     
     async def _request(self, method: str, path: str, params=None, json=None):
         '''
-        Base request helper method with retry logic.
-        Generates HTTP errors and retries on decode errors.
+        Base request helper method.
+        Concurrent identical GET requests share a single in-flight
+        request. If the request that sent it is cancelled, the waiting
+        requests re-issue it, one of them taking over as sender.
+        Non-idempotent methods are always sent.
+        Returns JSON serialization of response.
+        '''
+        if method != "GET":
+            return await self._send_request(method, path, params=params, json=json)
+
+        key = (path, tuple(sorted(params.items())) if params else ())
+
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except _LeaderCancelled:
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            response = await self._send_request(method, path, params=params, json=json)
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception() # Mark retrieved when there are no waiters
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception() # Mark retrieved when there are no waiters
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _send_request(self, method: str, path: str, params=None, json=None):
+        '''
+        Sends a request with retry logic.
+        Generates HTTP errors and retries GET requests on decode errors.
+        Decode errors on POST/DELETE raise APIError without retrying.
+        Rate-limited requests are retried after the server-requested
+        delay; RateLimitError is raised once retries are exhausted.
         Returns JSON serialization of response.      
         '''
         if self.client is None:
             raise RuntimeError("Client not initialized. Must be connected first.")
 
-        url = self.base_url + path
+        # Encode body once with orjson, bypassing httpx's stdlib encoder
+        content = orjson.dumps(json) if json is not None else None
+
         for attempt in range(self.max_retries):
             try:
-                headers = self._gen_headers(method=method, path=path)
-
-                logger.info(f"Method: {method}. URL: {url}. Params: {params}. JSON: {json}")
-
-                response = await self.client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    json=json,
-                    timeout=self.time_out
-                )
+                headers = self.session.gen_headers(method=method, path=path)
+                if content is not None:
+                    headers['Content-Type'] = 'application/json'
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Method: %s. Path: %s. Params: %s. JSON: %s", method, path, params, json)
+
+                async with self._semaphore:
+                    response = await self.client.request(
+                        method=method,
+                        url=path,
+                        headers=headers,
+                        params=params,
+                        content=content,
+                        timeout=self.time_out
+                    )
 
                 response.raise_for_status()
                 try:
-                    return response.json()
-                except JSONDecodeError as e:
-                    logger.error(f"Response decode error: {e}")
+                    return orjson.loads(response.content)
+                except orjson.JSONDecodeError as e:
+                    logger.error("Response decode error: %s", e)
+                    # The request may have been applied, never resubmit non-idempotent requests
+                    if method in ("POST", "DELETE"):
+                        raise APIError("Bad response body") from e
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(self._backoff_delay(attempt))
                     continue
 
             except httpx.TimeoutException:
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
+                    await asyncio.sleep(self._backoff_delay(attempt))
                     continue
                 raise APIError("Request timed out")
             except httpx.HTTPStatusError as e:
@@ -112,20 +265,45 @@ class KalshiAPI:
                 if status_code == 401:
                     raise AuthError("Authentication failed") from e
                 elif status_code == 429:
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(self._rate_limit_delay(e.response, attempt))
+                        continue
                     raise RateLimitError("Rate limit exceeded") from e
                 elif status_code >= 500 and attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
+                    await asyncio.sleep(self._backoff_delay(attempt))
                     continue
                 else:
-                    logger.error(f"API error ({status_code})")
+                    logger.error("API error (%s)", status_code)
             except httpx.RequestError as e:
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay)
+                    await asyncio.sleep(self._backoff_delay(attempt))
                     continue
                 raise APIError(f"Network error: {e}") from e
 
         raise APIError("Max retries exceeded")
 
+    async def _cached_get(self, path: str, params: dict | None = None, ttl: float = 0):
+        '''
+        GET request helper that returns the cached response for
+        (path, params) if it is younger than ttl seconds.
+        Concurrent misses share a single in-flight request.
+        A ttl of 0 bypasses the cache.
+        Returns JSON serialization of response.
+        '''
+        if ttl <= 0:
+            return await self._request(method="GET", path=path, params=params)
+
+        key = (path, frozenset(params.items()) if params else None)
+
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        response = await self._request(method="GET", path=path, params=params)
+        self._cache[key] = (time.monotonic(), response)
+
+        return response
+
     async def get_orders(self, ticker: str | None = None, event_ticker:str | None = None, min_ts: int | None = None, max_ts: int| None = None, status: str | None = None, limit: int=100, cursor: str | None = None):
         '''
         Makes GET request to get_orders endpoint.
@@ -133,19 +311,17 @@ class KalshiAPI:
         Returns:
             Response JSON
         '''
-        path = '/trade-api/v2/portfolio/orders'
-
-        payload = {
-            "ticker":  ticker,
-            "event_ticker": event_ticker,
-            "min_ts": min_ts,
-            "max_ts": max_ts,
-            "status": status,
-            "limit": limit,
-            "cursor": cursor
-        }
-        payload = {k: v for k, v in payload.items() if v is not None}
-        response = await self._request(method="GET", path=path, params=payload)
+        payload = {k: v for k, v in (
+            ("ticker", ticker),
+            ("event_ticker", event_ticker),
+            ("min_ts", min_ts),
+            ("max_ts", max_ts),
+            ("status", status),
+            ("limit", limit),
+            ("cursor", cursor)
+        ) if v is not None}
+
+        response = await self._request(method="GET", path=_ORDERS_PATH, params=payload)
         
         return response
 
@@ -156,31 +332,99 @@ class KalshiAPI:
         Returns:
             Response JSON
         '''
-        path = '/trade-api/v2/portfolio/positions'
+        payload = {k: v for k, v in (
+            ("ticker", ticker),
+            ("event_ticker", event_ticker),
+            ("limit", limit),
+            ("cursor", cursor),
+            ("count_filter", count_filter)
+        ) if v is not None}
 
-        payload = {
-            "ticker":  ticker,
-            "event_ticker": event_ticker,
-            "limit": limit,
-            "cursor": cursor,
-            "count_filter": count_filter
-        }
-
-        payload = {k: v for k, v in payload.items() if v is not None}
-        response = await self._request(method="GET", path=path, params=payload)
+        response = await self._request(method="GET", path=_POSITIONS_PATH, params=payload)
 
         return response
 
-    async def get_balance(self):
+    async def iter_orders(self, ticker: str | None = None, event_ticker: str | None = None, min_ts: int | None = None, max_ts: int | None = None, status: str | None = None, limit: int = 100) -> AsyncIterator[dict]:
+        '''
+        Yields orders from the get_orders endpoint page by page,
+        following the response cursor. Only one page is held at
+        a time and records are usable before later pages are fetched.
+        Generates HTTP status errors.
+        '''
+        cursor = None
+        while True:
+            response = await self.get_orders(ticker=ticker, event_ticker=event_ticker, min_ts=min_ts, max_ts=max_ts,
+                                             status=status, limit=limit, cursor=cursor)
+            for order in response.get("orders", []):
+                yield order
+
+            cursor = response.get("cursor")
+            if not cursor:
+                return
+
+    async def iter_market_positions(self, limit: int = 100, count_filter: str | None = None, ticker: str | None = None, event_ticker: str | None = None) -> AsyncIterator[dict]:
+        '''
+        Yields market positions from the get_positions endpoint page
+        by page, following the response cursor. Only one page is held
+        at a time and records are usable before later pages are fetched.
+        Generates HTTP status errors.
+        '''
+        cursor = None
+        while True:
+            response = await self.get_positions(cursor=cursor, limit=limit, count_filter=count_filter,
+                                                ticker=ticker, event_ticker=event_ticker)
+            for position in response.get("market_positions", []):
+                yield position
+
+            cursor = response.get("cursor")
+            if not cursor:
+                return
+
+    async def get_position_map(self, ttl: float = .5) -> dict:
+        '''
+        Returns a [ticker, position] map of all market positions.
+        The map is built once per fetch and shared by every caller
+        for ttl seconds.
+        Generates HTTP status errors.
+        '''
+        cached = self._position_map
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        positions = {position["ticker"]: position["position"] async for position in self.iter_market_positions()}
+        self._position_map = (time.monotonic(), positions)
+
+        return positions
+
+    def invalidate_position_map(self) -> None:
+        '''
+        Drops the cached position map so the next
+        get_position_map call fetches fresh positions.
+        '''
+        self._position_map = None
+
+    async def get_market_position(self, ticker: str) -> int | None:
+        '''
+        Returns the position held in ticker, fetched uncached from the
+        get_positions endpoint filtered to that market. Returns None if
+        the account has no position record for ticker.
+        Generates HTTP status errors.
+        '''
+        async for position in self.iter_market_positions(ticker=ticker):
+            if position["ticker"] == ticker:
+                return position["position"]
+
+        return None
+
+    async def get_balance(self, ttl: float = .5):
         '''
         Makes GET request to get_balance endpoint.
+        Responses are cached for ttl seconds.
         Generates HTTP status errors.
         Returns:
             Response JSON
         '''
-        path = '/trade-api/v2/portfolio/balance'
-
-        response = await self._request(method="GET", path=path)
+        response = await self._cached_get(path=_BALANCE_PATH, ttl=ttl)
 
         return response
     
@@ -191,10 +435,9 @@ class KalshiAPI:
         Returns:
             Response JSON
         '''
-        path = f'/trade-api/v2/markets/{ticker}/orderbook'
         params = {"depth": depth}
 
-        response = await self._request(method="GET", path=path, params=params)
+        response = await self._request(method="GET", path=_orderbook_path(ticker), params=params)
 
         return response
     
@@ -209,16 +452,14 @@ class KalshiAPI:
         Returns:
             Response JSON
         '''
-        path = '/trade-api/v2/portfolio/orders/batched'
-
         payload = {"orders": orders}
 
-        response = await self._request(method="POST", path=path, json=payload)
+        response = await self._request(method="POST", path=_BATCHED_ORDERS_PATH, json=payload)
 
         for order_obj in response.get("orders", []):
             order = order_obj.get("order", {})
             if (error := order.get("error")) is not None:
-                logger.error(f"Order Creation Error. {error}")  
+                logger.error("Order Creation Error. %s", error)
 
         return response
 
@@ -229,50 +470,66 @@ class KalshiAPI:
         Returns:
             Response JSON
         '''
-        path = '/trade-api/v2/portfolio/orders/batched'
-
         payload = {"ids": orders}
 
-        response = await self._request(method="DELETE", path=path, json=payload)
+        response = await self._request(method="DELETE", path=_BATCHED_ORDERS_PATH, json=payload)
 
         return response
 
-    async def get_event(self, event_ticker: str):
+    async def submit_order(self, order: dict) -> dict:
+        '''
+        Submits a single order through the batching gate. Concurrent
+        submissions within the linger window share one batch_create_orders
+        call.
+        Generates HTTP status errors.
+        Returns:
+            The order's entry of the batch response JSON
+        '''
+        return await self._order_batcher.submit(order)
+
+    async def submit_cancel(self, order_id: str) -> dict:
+        '''
+        Submits a single cancellation through the batching gate. Concurrent
+        submissions within the linger window share one batch_cancel_orders
+        call.
+        Generates HTTP status errors.
+        Returns:
+            The order's entry of the batch response JSON
+        '''
+        return await self._cancel_batcher.submit(order_id)
+
+    async def get_event(self, event_ticker: str, ttl: float = 5):
         '''
         Makes GET request to get_event endpoint.
+        Responses are cached for ttl seconds.
         Generates HTTP status errors.
         Returns:
             Response JSON
         '''
-        path = f'/trade-api/v2/events/{event_ticker}'
-
-        response = await self._request(method="GET", path=path)
+        response = await self._cached_get(path=_event_path(event_ticker), ttl=ttl)
 
         return response
     
-    async def get_market(self, market_ticker: str):
+    async def get_market(self, market_ticker: str, ttl: float = 5):
         '''
         Makes GET request to markets endpoint.
+        Responses are cached for ttl seconds.
         Generates HTTP status errors.
         Returns:
             Response JSON
         '''
-
-        path = f'/trade-api/v2/markets/{market_ticker}'
-
-        response = await self._request(method="GET", path=path)
+        response = await self._cached_get(path=_market_path(market_ticker), ttl=ttl)
         
         return response
 
-    async def get_user_data_timestamp(self):
+    async def get_user_data_timestamp(self, ttl: float = .5):
         '''
         Makes GET request to get_user_data_timestamp endpoint.
+        Responses are cached for ttl seconds.
         Generates HTTP status errors.
         Returns:
             Response JSON
         '''
-        path = '/trade-api/v2/exchange/user_data_timestamp'
-
-        response = await self._request(method="GET", path=path)
+        response = await self._cached_get(path=_USER_DATA_TIMESTAMP_PATH, ttl=ttl)
 
         return response
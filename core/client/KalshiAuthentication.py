@@ -5,6 +5,8 @@ from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from cryptography.exceptions import InvalidSignature
 import datetime
 
+_SIGNATURE_CACHE_SIZE = 256
+
 class KalshiAuthentication:
     '''
     Representation of Kalshi API auth information
@@ -16,6 +18,13 @@ class KalshiAuthentication:
     def __init__(self, path_to_private_key: str, access_key: str):
         self.path_to_private_key = path_to_private_key
         self.access_key = access_key
+
+        # [text, signature] map. Signed text is timestamp-prefixed, so
+        # entries are only reused within the same millisecond.
+        self._signature_cache = {}
+
+        # [(method, path), bytes] map of encoded signature message suffixes
+        self._sig_suffix_cache = {}
         
         try:
             self.private_key = self.load_private_key_from_file(path_to_private_key)
@@ -34,11 +43,15 @@ class KalshiAuthentication:
                 )
         return private_key
     
-    def sign_pss_text(self, text: str):
+    def sign_pss_text(self, text: str | bytes):
         '''
-        Signs text with session private key
+        Signs text (str or UTF-8 bytes) with session private key.
+        Reuses the signature of identical text.
         '''
-        message = text.encode('utf-8')
+        if (cached := self._signature_cache.get(text)) is not None:
+            return cached
+
+        message = text if isinstance(text, bytes) else text.encode('utf-8')
         try:
             signature = self.private_key.sign(
                 message,
@@ -48,10 +61,42 @@ class KalshiAuthentication:
                 ),
                 hashes.SHA256()
             )
-            return base64.b64encode(signature).decode('utf-8')
         except InvalidSignature as e:
             raise ValueError("RSA sign PSS failed") from e
+
+        if len(self._signature_cache) >= _SIGNATURE_CACHE_SIZE:
+            self._signature_cache.clear()
+
+        encoded = base64.b64encode(signature).decode('utf-8')
+        self._signature_cache[text] = encoded
+        return encoded
     
+    def gen_headers(self, method: str, path: str) -> dict:
+        '''
+        Generates signature and timestamp string for request authentication. Formats into Kalshi
+        API header format.
+        Returns headers.
+        '''
+        timestampt_str = self.gen_timestampstr()
+
+        # Only the timestamp prefix changes per request, the encoded
+        # method + path suffix is cached per endpoint
+        suffix = self._sig_suffix_cache.get((method, path))
+        if suffix is None:
+            path_without_query = path if '?' not in path else path.split('?', 1)[0]
+            suffix = (method + path_without_query).encode('utf-8')
+            self._sig_suffix_cache[(method, path)] = suffix
+
+        sig = self.sign_pss_text(timestampt_str.encode('utf-8') + suffix)
+
+        headers = {
+            'KALSHI-ACCESS-KEY': self.access_key,
+            'KALSHI-ACCESS-SIGNATURE': sig,
+            'KALSHI-ACCESS-TIMESTAMP': timestampt_str
+        }
+
+        return headers
+
     def gen_timestampstr(self) -> str:
         '''
         Generates the current timestamp string 
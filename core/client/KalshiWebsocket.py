@@ -1,13 +1,13 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from .KalshiAuthentication import KalshiAuthentication
-from .KalshiWebsocketResponses import FillEnvelope, OrderBookDeltaEnvelope, OrderBookSnapshotEnvelope
+from .KalshiWebsocketResponses import (ENVELOPE_DECODER, OrderBookDeltaEnvelope, OrderBookSnapshotEnvelope,
+                                       FillEnvelope, SubscribedEnvelope, ErrorEnvelope)
 import websockets
-import json
+import msgspec
 import logging
 import asyncio
-import time
-from pydantic import BaseModel, ValidationError
+import re
 from typing import Literal
 from live_trading.RiskExceptions import *
 
@@ -18,6 +18,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("kalshi_websocket")
 
+# Control message templates. Message formats are fixed and tickers are
+# exchange-provided, so payloads are formatted without serialization.
+_SUB_ORDERBOOK = '{{"id":{id},"cmd":"subscribe","params":{{"channels":["orderbook_delta"],"market_ticker":"{ticker}"}}}}'
+_UNSUB = '{{"id":{id},"cmd":"unsubscribe","params":{{"sids":[{sids}]}}}}'
+_SUB_FILLS = '{{"id":{id},"cmd":"subscribe","params":{{"channels":["fill"]}}}}'
+_SUB_TRADES = '{{"id":{id},"cmd":"subscribe","params":{{"channels":["trades"],"market_ticker":"{ticker}"}}}}'
+
+# Bound decode method of the envelope decoder singleton, saves an
+# attribute lookup per message
+_decode_envelope = ENVELOPE_DECODER.decode
+
+# Matches the envelope discriminator, emitted by Kalshi before the message body,
+# so only the head of a frame is scanned. Only used to classify messages that
+# fail validation.
+_TYPE_RE = re.compile(rb'"type"\s*:\s*"([a-z_]+)"')
+_TYPE_SCAN_LEN = 128
+
 class KalshiWebsocket:
     '''
     Websocket class for KalshiAPI.
@@ -44,15 +61,17 @@ class KalshiWebsocket:
     is_running: bool      # Retry connect iff is_running
 
     # Channel, sid, ticker mappings
-    ticker_to_sid: dict    # [ticker, sid] map
-    sid_to_ticker: dict    # [sid, ticker] map
+    subs: dict             # [ticker, sid] map, the inverse is derived on demand
     pending_requests: dict # [message_id, ticker] map
 
     # Orderbook rebuild flag
     pending_snapshot: bool
 
+    # Receive/handle decoupling
+    queue_size: int       # Maximum number of received, unhandled messages
+
     def __init__(self, session: KalshiAuthentication, max_retries: int = 5, 
-                 base_delay: float = 1.0, max_delay: float = 60.0):
+                 base_delay: float = 1.0, max_delay: float = 60.0, queue_size: int = 1024):
         self.session = session
         self.market = None
         self.executor = None
@@ -67,14 +86,30 @@ class KalshiWebsocket:
 
         self.retries = 0
 
-        self.ticker_to_sid = {} # [str, int]
-        self.sid_to_ticker = {} # [int, str]
+        self.subs = {} # [str, int]
+        self._subs_version = 0
+        self._sid_to_ticker = ({}, 0)
 
         self.pending_requests = {} # [int, str]
 
         self.pending_snapshot = False
         self.is_running = False
 
+        self.queue_size = queue_size
+        self._queue = None
+
+    @property
+    def sid_to_ticker(self) -> dict:
+        '''
+        [sid, ticker] map derived from subs.
+        Rebuilt only after subs has changed.
+        '''
+        inverse, version = self._sid_to_ticker
+        if version != self._subs_version:
+            inverse = {sid: ticker for ticker, sid in self.subs.items()}
+            self._sid_to_ticker = (inverse, self._subs_version)
+        return inverse
+
     def set_executor(self, executor: Executor) -> None:
         '''
         Injects executor dependency
@@ -87,27 +122,6 @@ class KalshiWebsocket:
         '''
         self.market = market
 
-    def _gen_headers(self, method: str, path: str) -> dict:
-        '''
-        Generates signature and timestamp string for request authentication. Formats into Kalshi
-        API header format.
-        Returns headers.
-        '''
-        timestampt_str = self.session.gen_timestampstr()
-
-        path_without_query = path.split('?')[0]
-        msg_string = timestampt_str + method + path_without_query
-
-        sig = self.session.sign_pss_text(msg_string)
-
-        headers = {
-            'KALSHI-ACCESS-KEY': self.session.access_key,
-            'KALSHI-ACCESS-SIGNATURE': sig,
-            'KALSHI-ACCESS-TIMESTAMP': timestampt_str
-        }
-
-        return headers
-    
     async def connect(self) -> None:
         '''
         Establishes connection to websocket with retry logic
@@ -116,18 +130,19 @@ class KalshiWebsocket:
         '''
         while self.retries < self.max_retries:
             try:
-                headers = self._gen_headers("GET", "/trade-api/ws/v2")
+                headers = self.session.gen_headers("GET", "/trade-api/ws/v2")
                 self.ws = await websockets.connect(self.ws_url, 
                                                    additional_headers=headers, 
                                                    ping_interval=10, 
-                                                   ping_timeout=10)
+                                                   ping_timeout=10,
+                                                   compression=None)
                 self.retries = 0
                 logger.info("Websocket connected successfully")
                 return
             except Exception as e:
                 self.retries += 1
-                delay = min(self.base_delay * (2 ** (self.retries - 1)), self.max_delay)
-                logger.error(f"Connection failed: {e}. Retrying in {delay}s... (attempt {self.retries})")
+                delay = min(self.base_delay * (1 << (self.retries - 1)), self.max_delay)
+                logger.error("Connection failed: %s. Retrying in %ss... (attempt %s)", e, delay, self.retries)
                 await asyncio.sleep(delay)
         
         raise Exception(f"Failed to connect after {self.retries} attempts.")
@@ -135,21 +150,40 @@ class KalshiWebsocket:
     async def _restore_subs(self):
         '''
         Restores existing orderbook subscriptions.
-        Clears and rebuilds ticker-sid maps.
+        Clears the ticker-sid map once every subscription is sent,
+        to be rebuilt from the responses. On failure the map is
+        kept so the next reconnect restores it again.
+
+        Raises RuntimeError if websocket is not connected.
         '''
-        tickers = list(self.ticker_to_sid.keys())
+        if self.ws is None:
+            raise RuntimeError("Websocket not connected")
+
+        tickers = list(self.subs)
 
         if not tickers:
             logger.info("No subscriptions to restore")
             return
 
-        logger.info(f"Restoring {len(tickers)} orderbook subscriptions...")
+        logger.info("Restoring %s orderbook subscriptions...", len(tickers))
 
-        self.ticker_to_sid.clear()
-        self.sid_to_ticker.clear()
-        
-        for ticker in tickers:
-            await self.subscribe_orderbook(ticker)
+        # Reserve message ids up front and write all frames together
+        # rather than awaiting each subscription in turn
+        first_id = self.message_id
+        self.message_id += len(tickers)
+        request_ids = range(first_id, first_id + len(tickers))
+        self.pending_requests.update(zip(request_ids, tickers))
+
+        payloads = [_SUB_ORDERBOOK.format(id=msg_id, ticker=ticker) for msg_id, ticker in zip(request_ids, tickers)]
+        try:
+            await asyncio.gather(*(self.ws.send(payload) for payload in payloads))
+        except BaseException:
+            for msg_id in request_ids:
+                self.pending_requests.pop(msg_id, None)
+            raise
+
+        self.subs.clear()
+        self._subs_version += 1
 
     async def subscribe_orderbook(self, ticker: str) -> None:
         '''
@@ -158,53 +192,38 @@ class KalshiWebsocket:
 
         Raises RuntimeError if websocket is not connected.
         '''
-        subscription = {
-            "id": self.message_id,
-            "cmd": "subscribe",
-            "params": {
-                "channels": ["orderbook_delta"],
-                "market_ticker": ticker
-            }
-        }
+        subscription = _SUB_ORDERBOOK.format(id=self.message_id, ticker=ticker)
 
         self.pending_requests[self.message_id] = ticker
 
         if self.ws is None:
             raise RuntimeError("Websocket not connected")
         
-        await self.ws.send(json.dumps(subscription))
+        await self.ws.send(subscription)
         self.message_id += 1
     
     async def unsubscribe_orderbook(self, ticker: str) -> None:
         '''
         Attempts to unsubscribe from ticker's orderbook feed and increments message_id.
-        Maintains ticker-sid maps.
+        Maintains the ticker-sid map.
 
         Raises RuntimeError if websocket is not connected.
         '''
-        if ticker not in self.ticker_to_sid:
-            logger.warning(f"Cannot unsubscribe from {ticker} - not subscribed")
+        sid = self.subs.get(ticker)
+        if sid is None:
+            logger.warning("Cannot unsubscribe from %s - not subscribed", ticker)
             return
         
-        sid = self.ticker_to_sid[ticker]
-        unsubscription = {
-            "id": self.message_id,
-            "cmd": 'unsubscribe',
-            "params": {
-                "sids": [sid]
-            }
-        }
+        unsubscription = _UNSUB.format(id=self.message_id, sids=sid)
 
         if self.ws is None:
             raise RuntimeError("Websocket not connected")
         
-        await self.ws.send(json.dumps(unsubscription))
+        await self.ws.send(unsubscription)
         self.message_id += 1
 
-        # Atomic deletion sequence to ensure sync between mappings
-        if ticker in self.ticker_to_sid:
-            del self.ticker_to_sid[ticker]
-            del self.sid_to_ticker[sid]
+        if self.subs.pop(ticker, None) is not None:
+            self._subs_version += 1
 
     async def subscribe_fills(self) -> None:
         '''
@@ -212,18 +231,12 @@ class KalshiWebsocket:
 
         Raises RuntimeError if websocket is not connected.
         '''
-        subscription = {
-            "id": self.message_id,
-            "cmd": "subscribe",
-            "params": {
-                "channels": ["fill"]
-            }
-        }
+        subscription = _SUB_FILLS.format(id=self.message_id)
 
         if self.ws is None:
             raise RuntimeError("Websocket not connected")
     
-        await self.ws.send(json.dumps(subscription))
+        await self.ws.send(subscription)
         self.message_id += 1
     
     async def subscribe_trades(self, ticker: str) -> None:
@@ -232,18 +245,11 @@ class KalshiWebsocket:
         
         Raises RuntimeError if websocket is not connected.
         '''
-        subscription = {
-            "id": self.message_id,
-            "cmd": "subscribe",
-            "params": {
-                "channels": ["trades"],
-                "market_ticker": ticker
-            }
-        }
+        subscription = _SUB_TRADES.format(id=self.message_id, ticker=ticker)
         if self.ws is None:
             raise RuntimeError("Websocket not connected")
         
-        await self.ws.send(json.dumps(subscription))
+        await self.ws.send(subscription)
         self.message_id += 1
 
     async def _rebuild_on_gap(self, ticker: str) -> None:
@@ -267,10 +273,11 @@ class KalshiWebsocket:
         '''
         await self._rebuild_on_gap(ticker)
 
-    async def handle_msg(self, message) -> None:
+    async def handle_msg(self, message: bytes | str) -> None:
         '''
         Handles and routes all messages for supported channels: orderbook_delta and fill.
-        Validates all messages for supported channels against response models and schemas.
+        Validates and dispatches each message against the envelope union directly
+        from the raw JSON.
 
         Calls callbacks for respective channel message handling.
         Rebuilds orderbook on malformed orderbook message.
@@ -279,72 +286,82 @@ class KalshiWebsocket:
 
         Raises exception for authentication failures and logs all others.
         '''
-        data = json.loads(message)
-        timestamp = time.time()
-        msg_type = data.get("type")
-
-        if msg_type == "subscribed":
-            id = data['id']
-            channel = data['msg']["channel"]
-            sid = data['msg']['sid']
+        try:
+            envelope = _decode_envelope(message)
+        except msgspec.DecodeError as e:
+            await self._handle_invalid_msg(message, e)
+            return
 
-            if channel == "orderbook_delta":
-                ticker = self.pending_requests.pop(id, None)
-                self.sid_to_ticker[sid] = ticker
-                self.ticker_to_sid[ticker] = sid
-            
-                logger.info(f"Subscribed to {channel} for ticker {ticker} (sid={sid}).")
-            else:
-                logger.info(f"Subscribed to channel {channel} (sid={sid})")
+        # Deltas dominate traffic, dispatch them on an exact type check
+        # before falling through to the pattern match
+        if type(envelope) is OrderBookDeltaEnvelope:
+            # ignore deltas if sequence chain broken
+            if self.pending_snapshot:
+                logger.debug("Ignoring delta while rebuilding orderbook...")
+                return
+            await self.market.update(envelope)
+            return
 
-        try:
-            if msg_type == "orderbook_snapshot":
-                envelope = OrderBookSnapshotEnvelope.model_validate(data)
+        match envelope:
+            case OrderBookSnapshotEnvelope():
                 self.pending_snapshot = False
                 logger.info("Orderbook snapshot received")
                 await self.market.update(envelope)
 
-            elif msg_type == "orderbook_delta":
-                envelope = OrderBookDeltaEnvelope.model_validate(data)
-                # ignore deltas if sequence chain broken
-                if self.pending_snapshot:
-                    logger.debug("Ignoring delta while rebuilding orderbook...")
-                    return
-                await self.market.update(envelope)
-        
-        except ValidationError as e:
-            logger.error(f"Invalid orderbook received: {e}")
-            await self.handle_gap(self.market.ticker)   
-
-        try:
-            if msg_type == "fill":
-                envelope = FillEnvelope.model_validate(data)
-                logger.info(f"Fill received: {envelope.msg.trade_id}")
+            case FillEnvelope():
+                logger.info("Fill received: %s", envelope.msg.trade_id)
                 self.executor.on_fill(envelope.msg)
 
-        except ValidationError as e:
-            await self.executor.reconcile()
-        
-        if msg_type == "error":
-            code = data.get('msg', {}).get('code')
-            msg = data.get('msg', {}).get('msg')
-            id = data.get('id')
+            case SubscribedEnvelope():
+                channel = envelope.msg.channel
+                sid = envelope.msg.sid
 
-            logger.error(f"Server error {code}: {msg} (msg_id={id})")
+                if channel == "orderbook_delta":
+                    ticker = self.pending_requests.pop(envelope.id, None)
+                    self.subs[ticker] = sid
+                    self._subs_version += 1
 
-            if code == 6:
-                pass
-            elif code == 401:
-                logger.critical("Websocket Auth failed")
-                raise Exception("Websocket Auth failed")
-            else:
-                logger.warning(f"Unhandled error code: {code}")
-        
+                    logger.info("Subscribed to %s for ticker %s (sid=%s).", channel, ticker, sid)
+                else:
+                    logger.info("Subscribed to channel %s (sid=%s)", channel, sid)
+
+            case ErrorEnvelope():
+                code = envelope.msg.code
+
+                logger.error("Server error %s: %s (msg_id=%s)", code, envelope.msg.msg, envelope.id)
+
+                if code == 6:
+                    pass
+                elif code == 401:
+                    logger.critical("Websocket Auth failed")
+                    raise Exception("Websocket Auth failed")
+                else:
+                    logger.warning("Unhandled error code: %s", code)
+
+    async def _handle_invalid_msg(self, message: bytes | str, error: msgspec.DecodeError) -> None:
+        '''
+        Handles messages that failed envelope validation.
+        Rebuilds orderbook on malformed orderbook messages and reconciles
+        on malformed fills. Unsupported message types are ignored.
+        '''
+        head = message[:_TYPE_SCAN_LEN]
+        if isinstance(head, str):
+            head = head.encode()
+
+        type_match = _TYPE_RE.search(head)
+        msg_type = type_match.group(1) if type_match else None
+
+        if msg_type in (b"orderbook_delta", b"orderbook_snapshot"):
+            logger.error("Invalid orderbook received: %s", error)
+            await self.handle_gap(self.market.ticker)
+        elif msg_type == b"fill":
+            logger.error("Invalid fill received: %s", error)
+            await self.executor.reconcile()
+        elif msg_type is None:
+            logger.error("Failed to parse message: %s", error)
         else:
-            pass
+            logger.debug("Unhandled message type: %s", msg_type.decode())
 
-        return
-        
     async def close(self) -> None:
         '''
         Close websocket connection and unset running flag.
@@ -357,36 +374,75 @@ class KalshiWebsocket:
             try:
                 await self.ws.close()
             except Exception as e:
-                logger.error(f"Error closing Websocket: {e}")
+                logger.error("Error closing Websocket: %s", e)
         
         logger.info("Websocket closed")
 
 
+    async def _receive(self) -> None:
+        '''
+        Reads frames into the message queue until the
+        connection closes. Blocks when the queue is full so
+        messages are never dropped.
+
+        Frames are received as undecoded bytes; the decoder
+        validates UTF-8 as it parses.
+        '''
+        recv = self.ws.recv
+        put = self._queue.put
+        while True:
+            await put(await recv(decode=False))
+
+    async def _consume(self) -> None:
+        '''
+        Handles queued messages in arrival order.
+        Logs and swallows handler exceptions.
+        '''
+        handle_msg = self.handle_msg
+        get = self._queue.get
+        while True:
+            message = await get()
+            try:
+                await handle_msg(message)
+            except Exception as e:
+                logger.error("Failed to handle message: %s", e, exc_info=True)
+
     async def run(self) -> None:
         '''
         Initializes websocket if not started, then runs
-        listen-handle loop. Exits on is_running flag and 
+        the receive loop, with messages handled on a separate
+        consumer task. Exits on is_running flag and 
         swallows all other exceptions.
         '''
         self.is_running = True
 
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        consumer = asyncio.create_task(self._consume())
+
+        try:
+            await self._run_connection()
+        finally:
+            consumer.cancel()
+            try:
+                await consumer
+            except asyncio.CancelledError:
+                pass
+
+    async def _run_connection(self) -> None:
+        '''
+        Connect-receive loop with reconnect on close.
+        '''
         while self.is_running:
             try:
                 if self.ws is None:
                     await self.connect()
-                    if self.ticker_to_sid:
+                    if self.subs:
                         await self._restore_subs()
-                
-                async for message in self.ws:
-                    try:
-                        await self.handle_msg(message)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to parse message: {e}")
-                    except Exception as e:
-                        logger.error(f"Failed to handle message: {e}", exc_info=True)
+
+                await self._receive()
             
             except websockets.exceptions.ConnectionClosed as e:
-                logger.warning(f"WebSocket closed: code={e.code}, reason={e.reason}")
+                logger.warning("WebSocket closed: code=%s, reason=%s", e.code, e.reason)
                 
                 if self.is_running:
                     logger.info("Reconnecting")
@@ -395,7 +451,7 @@ class KalshiWebsocket:
                     break
             
             except Exception as e:
-                logger.error(f"Unexpected error in run loop: {e}", exc_info=True)
+                logger.error("Unexpected error in run loop: %s", e, exc_info=True)
             
             if not self.is_running:
                 break
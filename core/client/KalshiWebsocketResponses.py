@@ -1,46 +1,55 @@
-from pydantic import BaseModel, field_validator
-from typing import Literal, Optional
-from datetime import datetime
+import msgspec
+from typing import ClassVar, Literal, Optional, Union
+from datetime import datetime, timedelta, timezone
 
 '''
-Pydantic validation schemas for fill and orderbook messages and envelopes
+msgspec validation schemas for fill, orderbook, and control messages and envelopes.
+
+Envelopes form a tagged union on their "type" field so a single decoder
+validates and dispatches any supported message in one pass.
 '''
 
-class OrderBookDeltaMsg(BaseModel):
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+class OrderBookDeltaMsg(msgspec.Struct, frozen=True):
     market_ticker: str
     side: Literal["yes", "no"]
     price_dollars: float
     delta: int
-    ts: int # in POSIX (ns)
-
-    @field_validator('ts', mode='before')
-    @classmethod
-    def parse_timestamp(cls, v):
-        if isinstance(v, str):
-            dt = datetime.fromisoformat(v.replace('Z', '+00:00'))
-            return int(dt.timestamp() * 1_000_000_000)
-        return v
-
-class OrderBookDeltaEnvelope(BaseModel):
-    type: Literal["orderbook_delta"]
+    ts: int | datetime # in POSIX (ns), ISO 8601 strings are converted on decode
+
+    def __post_init__(self):
+        # msgspec parses ISO 8601 strings natively, convert with
+        # exact integer arithmetic rather than a float timestamp
+        ts = self.ts
+        if isinstance(ts, datetime):
+            if ts.tzinfo is None:
+                ts = ts.replace(tzinfo=timezone.utc)
+            msgspec.structs.force_setattr(self, 'ts', (ts - _EPOCH) // _MICROSECOND * 1000)
+
+class OrderBookDeltaEnvelope(msgspec.Struct, frozen=True, tag_field="type", tag="orderbook_delta"):
+    type: ClassVar[str] = "orderbook_delta"
+
     sid: int
     seq: int
     msg: OrderBookDeltaMsg
 
-class OrderBookSnapshotMsg(BaseModel):
+class OrderBookSnapshotMsg(msgspec.Struct, frozen=True):
     market_ticker: str
-    yes: Optional[list]
-    yes_dollars: Optional[list]
-    no: Optional[list]
-    no_dollars: Optional[list]
+    yes: Optional[list] = None
+    yes_dollars: Optional[list] = None
+    no: Optional[list] = None
+    no_dollars: Optional[list] = None
+
+class OrderBookSnapshotEnvelope(msgspec.Struct, frozen=True, tag_field="type", tag="orderbook_snapshot"):
+    type: ClassVar[str] = "orderbook_snapshot"
 
-class OrderBookSnapshotEnvelope(BaseModel):
-    type: Literal["orderbook_snapshot"]
     sid: int
     seq: int
     msg: OrderBookSnapshotMsg
 
-class FillMsg(BaseModel):
+class FillMsg(msgspec.Struct, frozen=True):
     trade_id: str
     order_id: str
     market_ticker: str
@@ -51,12 +60,38 @@ class FillMsg(BaseModel):
     action: Literal["buy", "sell"]
     post_position: int
     ts: int
+    is_taker: bool = False
+
+class FillEnvelope(msgspec.Struct, frozen=True, tag_field="type", tag="fill"):
+    type: ClassVar[str] = "fill"
 
-class FillEnvelope(BaseModel):
-    type: Literal["fill"]
     sid: int
     msg: FillMsg
 
-class SubscribedMsg(BaseModel):
+class SubscribedMsg(msgspec.Struct, frozen=True):
     channel: str
-    sid: int
\ No newline at end of file
+    sid: int
+
+class SubscribedEnvelope(msgspec.Struct, frozen=True, tag_field="type", tag="subscribed"):
+    type: ClassVar[str] = "subscribed"
+
+    id: int
+    msg: SubscribedMsg
+
+class ErrorMsg(msgspec.Struct, frozen=True):
+    code: Optional[int] = None
+    msg: Optional[str] = None
+
+class ErrorEnvelope(msgspec.Struct, frozen=True, tag_field="type", tag="error"):
+    type: ClassVar[str] = "error"
+
+    id: Optional[int] = None
+    msg: ErrorMsg = msgspec.field(default_factory=ErrorMsg)
+
+# Most frequent message types first
+KalshiEnvelope = Union[OrderBookDeltaEnvelope, OrderBookSnapshotEnvelope, FillEnvelope,
+                       SubscribedEnvelope, ErrorEnvelope]
+
+# Module-level decoder, built once and reused for every message.
+# Validates raw JSON and selects the envelope by "type" in a single pass.
+ENVELOPE_DECODER = msgspec.json.Decoder(KalshiEnvelope, strict=False)
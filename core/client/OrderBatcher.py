@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List
+import asyncio
+import logging
+
+logger = logging.getLogger("ks_rest")
+
+@dataclass(frozen=True)
+class BatcherConfig:
+    '''Configuration for order batching gates'''
+    max_batch: int = 20      # Maximum number of items sent in a single batch call
+    queue_size: int = 1000   # Maximum number of pending items
+    max_wait_ms: float = 10  # Linger window after the first item of a batch (ms)
+
+class OrderBatcher:
+    '''
+    Async batching gate that coalesces single-item submissions
+    into one batch call.
+
+    The first pending item opens a linger window of max_wait_ms, after
+    which (or once max_batch items are pending) the batch is sent. Results
+    are fanned back to each submitter by index into the response's
+    "orders" list.
+
+    The worker task is started lazily so it binds to the running loop.
+    '''
+
+    send_batch: Callable[[List[Any]], Awaitable[dict]] # Batch endpoint call
+    config: BatcherConfig
+
+    def __init__(self, send_batch: Callable[[List[Any]], Awaitable[dict]], config: BatcherConfig | None = None):
+        self.send_batch = send_batch
+        self.config = config or BatcherConfig()
+
+        self._queue = None
+        self._worker_task = None
+
+    async def submit(self, item: Any) -> dict:
+        '''
+        Queues item for the next batch and returns its
+        entry of the batch response.
+        Raises the batch call's exception on failure.
+        '''
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.config.queue_size)
+
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._worker())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+
+        return await future
+
+    async def _worker(self) -> None:
+        '''
+        Drains the queue into batches and dispatches them.
+        '''
+        loop = asyncio.get_running_loop()
+        max_wait = self.config.max_wait_ms / 1000
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + max_wait
+
+            while len(batch) < self.config.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: list) -> None:
+        '''
+        Sends the batch and resolves each submitter's future.
+        '''
+        try:
+            response = await self.send_batch([item for item, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        results = response.get("orders", [])
+        for i, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if i < len(results):
+                future.set_result(results[i])
+            else:
+                logger.error("Batch response missing entry %d of %d", i, len(batch))
+                future.set_result({})
+
+    async def close(self) -> None:
+        '''
+        Stops the worker task and fails any pending submissions.
+        '''
+        if self._worker_task:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
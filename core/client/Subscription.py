@@ -2,9 +2,9 @@ from dataclasses import dataclass
 
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Subscription:
     '''Representation of websocket subcription information'''
     sid: int
     channel: str
-    market_ticker: Optional[str]
+    market_ticker: Optional[str] = None
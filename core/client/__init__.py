@@ -1,7 +1,8 @@
 from .KalshiAPI import KalshiAPI
 from .KalshiWebsocket import KalshiWebsocket
 from .KalshiAuthentication import KalshiAuthentication
+from .OrderBatcher import OrderBatcher, BatcherConfig
 from .KalshiWebsocketResponses import OrderBookDeltaMsg, OrderBookSnapshotMsg, OrderBookDeltaEnvelope, FillEnvelope, FillMsg
 
 __all__ = ["KalshiWebsocket", "KalshiAPI", "KalshiAuthentication", "OrderBookDeltaMsg", "OrderBookSnapshotMsg",
-           "OrderBookDeltaEnvelope", "FillEnvelope",  "FillMsg"]
\ No newline at end of file
+           "OrderBookDeltaEnvelope", "FillEnvelope",  "FillMsg", "OrderBatcher", "BatcherConfig"]
\ No newline at end of file
@@ -1,5 +1,5 @@
 import websockets
-import json
+import orjson
 import asyncio
 from typing import Callable
 from .CryptoWebsocketResponses import TickerUpdate, IndexTick
@@ -7,6 +7,9 @@ import logging
 
 logger = logging.getLogger("crypto_websocket")
 
+# Subscription message template, channel names are fixed identifiers
+_SUBSCRIBE = '{{"method":"subscribe","params":{{"channels":[{channels}]}}}}'
+
 class CryptoWebsocket:
     '''
     Basic websocket class for the Crypto.com API
@@ -20,7 +23,7 @@ class CryptoWebsocket:
     subscriptions: set
     tick_state: TickerUpdate
     _running: bool
-    _msg_id: int
+    _msg_id: int   # Wraps at 2**31
 
     # Retry logic
     retries: int
@@ -44,6 +47,7 @@ class CryptoWebsocket:
 
         self._running = False
         self._msg_id = 0
+        self.retries = 0
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
@@ -53,42 +57,43 @@ class CryptoWebsocket:
         Increments message id and 
         returns the next id.
         '''
-        self._msg_id += 1
+        self._msg_id = (self._msg_id + 1) & 0x7FFFFFFF
         return self._msg_id
 
+    async def _backoff(self, attempt: int) -> None:
+        '''
+        Sleeps for the exponential back-off delay of
+        the attempt, capped at max_delay.
+        '''
+        await asyncio.sleep(min(self.base_delay * (1 << attempt), self.max_delay))
+
     async def run(self) -> None:
         '''
         Running loop with retry logic and exponential backup.
         Subscribes to channels and handles messages.
         '''
         self._running = True
-        retries = 0
-        delay = self.base_delay
+        self.retries = 0
 
-        while self._running and retries < self.max_retries:
+        while self._running and self.retries < self.max_retries:
             try:
-                async with websockets.connect(self.uri) as ws:
+                async with websockets.connect(self.uri, compression=None) as ws:
                     self.ws = ws
-                    retries = 0
-                    delay = self.base_delay
+                    self.retries = 0
                     
                     if self.subscriptions:
                         await self._send_subscribe(list(self.subscriptions))
 
-                    async for message in ws:
+                    while True:
+                        message = await ws.recv(decode=False)
                         if not self._running:
                             break
-                        data = json.loads(message)
+                        data = orjson.loads(message)
                         self._handle_message(data)
                         
-            except websockets.ConnectionClosed:
-                retries += 1
-                await asyncio.sleep(delay)
-                delay = min(delay * 2, self.max_delay)
-            except Exception as e:
-                retries += 1
-                await asyncio.sleep(delay)
-                delay = min(delay * 2, self.max_delay)
+            except Exception:
+                await self._backoff(self.retries)
+                self.retries += 1
         
         self._running = False
         self.ws = None
@@ -102,9 +107,9 @@ class CryptoWebsocket:
             raise RuntimeError("Crypto websocket not configured")
         
         self.subscriptions.update(channels)
-        msg = {"method": "subscribe", "params": {"channels": channels}}
+        msg = _SUBSCRIBE.format(channels=",".join(f'"{c}"' for c in channels))
         
-        response = await self.ws.send(json.dumps(msg))
+        response = await self.ws.send(msg)
 
         logger.info(f"Attempt subscribe to channels: {channels}.")
 
@@ -120,37 +125,45 @@ class CryptoWebsocket:
         Parses message data and dispatches message
         to respective handler.
         '''
-        logger.info(f"Data received: {data}")
+        logger.debug("Data received: %s", data)
 
-        type = data.get("result", {}).get("channel", None)
+        result = data.get("result")
+        if not result:
+            return
+
+        type = result.get("channel")
         if type == "index":
-            result = data.get("result", {}).get("data", [])
-            if result:
-                self._handle_index_tick(result[0])
-        if type == "ticker":
-            result = data.get("result", {}).get("data", [])
-            if result:
-                self._handle_ticker_update(result[0])
+            ticks = result.get("data")
+            if ticks:
+                self._handle_index_tick(ticks[0])
+        elif type == "ticker":
+            ticks = result.get("data")
+            if ticks:
+                self._handle_ticker_update(ticks[0])
 
         return
 
     def _handle_index_tick(self, data: dict) -> None:
         '''
-        Validates index update and calls the on-index-tick
+        Stores index update and calls the on-index-tick
         callback.
         '''
-        index_tick = IndexTick.model_validate(data)
-        self.index_state = index_tick
+        if self.index_state is None:
+            self.index_state = IndexTick.from_dict(data)
+        else:
+            self.index_state.update(data)
         if self.on_index_tick:
             self.on_index_tick()        
 
     def _handle_ticker_update(self, data: dict) -> None:
         '''
-        Validates ticker update and calls the on-ticker-tick
+        Stores ticker update and calls the on-ticker-tick
         callback.
         '''
-        tick = TickerUpdate.model_validate(data)
-        self.ticker_state = tick
+        if self.ticker_state is None:
+            self.ticker_state = TickerUpdate.from_dict(data)
+        else:
+            self.ticker_state.update(data)
         if self.on_ticker_tick:
             self.on_ticker_tick()
 
@@ -159,6 +172,9 @@ class CryptoWebsocket:
         Returns the most recent tick of the channel that is
         subscribed to. Defaults to the ticker stream if subscribed
         to both ticker and index channels.
+
+        The tick is updated in place by later messages, so callers
+        should read what they need before yielding to the loop.
         '''
         if self.ticker_state:
             return self.ticker_state
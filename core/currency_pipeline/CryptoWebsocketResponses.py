@@ -3,16 +3,26 @@ from pydantic import BaseModel
 from typing import Literal
 
 '''
-Pydantic validation schemas for Crypto.com Websocket Messages
+Schemas for Crypto.com Websocket Messages.
+
+Ticker and index payloads have a fixed shape and arrive on every
+tick, so they are plain slotted records built without validation. Both
+carry the underlying's price estimate as a float, computed once at
+ingest. The websocket keeps one record per channel and updates it in
+place on each tick rather than allocating a new one.
 '''
 
 class TickEnvelope(BaseModel):
     id: int
     method: Literal["subscribe"]
     
-class TickerUpdate(BaseModel):
-    
-    model_config = {"extra": "ignore"}
+class TickerUpdate:
+    '''
+    Latest ticker payload for an instrument. Mutated in place
+    by the websocket on every tick.
+    '''
+
+    __slots__ = ("h", "l", "a", "c", "b", "bs", "k", "ks", "i", "v", "vv", "oi", "t", "price")
 
     h: str
     l: str
@@ -27,7 +37,61 @@ class TickerUpdate(BaseModel):
     vv: str
     oi: str
     t: int
+    price: float # Mid of best bid (b) and best ask (k)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TickerUpdate":
+        '''
+        Builds a TickerUpdate from a raw ticker payload,
+        ignoring extra fields.
+        '''
+        tick = cls.__new__(cls)
+        tick.update(data)
+        return tick
+
+    def update(self, data: dict) -> None:
+        '''
+        Overwrites every field from a raw ticker payload,
+        ignoring extra fields. The payload is fully read before
+        any field is written, so a malformed one leaves the
+        record unchanged.
+        '''
+        b, k = data["b"], data["k"]
+        (self.h, self.l, self.a, self.c, self.b, self.bs, self.k, self.ks,
+         self.i, self.v, self.vv, self.oi, self.t, self.price) = (
+            data["h"], data["l"], data["a"], data["c"], b, data["bs"], k, data["ks"],
+            data["i"], data["v"], data["vv"], data["oi"], data["t"], .5 * (float(k) + float(b)))
+
+    def __repr__(self) -> str:
+        return f"TickerUpdate(i={self.i!r}, t={self.t}, b={self.b!r}, k={self.k!r}, price={self.price})"
+
+class IndexTick:
+    '''
+    Latest index payload. Mutated in place by the
+    websocket on every tick.
+    '''
+
+    __slots__ = ("v", "t", "price")
 
-class IndexTick(BaseModel):
     v: str
-    t: int
\ No newline at end of file
+    t: int
+    price: float # Index value
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IndexTick":
+        '''
+        Builds an IndexTick from a raw index payload.
+        '''
+        tick = cls.__new__(cls)
+        tick.update(data)
+        return tick
+
+    def update(self, data: dict) -> None:
+        '''
+        Overwrites every field from a raw index payload.
+        '''
+        v = data["v"]
+        self.v, self.t, self.price = v, data["t"], float(v)
+
+    def __repr__(self) -> str:
+        return f"IndexTick(v={self.v!r}, t={self.t}, price={self.price})"
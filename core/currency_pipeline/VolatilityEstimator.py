@@ -1,10 +1,31 @@
 import numpy as np
-from collections import deque
+from numba import njit
 from .BinanceAPI import BinanceAPI
 import time
 import math
 import logging
 
+@njit(cache=True)
+def rogers_kernel(ohlc: np.ndarray) -> tuple:
+    '''
+    Returns the Rogers-Satchell sum and number of valid rows
+    over (N, 4) float64 OHLC rows. Skips rows with h <= l or
+    non-positive prices.
+    '''
+    rs_sum = 0.0
+    valid = 0
+
+    for i in range(ohlc.shape[0]):
+        o, h, l, close = ohlc[i, 0], ohlc[i, 1], ohlc[i, 2], ohlc[i, 3]
+
+        if h <= l or min(o, h, l, close) <= 0:
+            continue
+
+        rs_sum += math.log(h/close) * math.log(h/o) + math.log(l/close) * math.log(l/o)
+        valid += 1
+
+    return rs_sum, valid
+
 class VolatilityEstimator:
     '''
     Base class for volatility estimation calculators based on candlestick
@@ -16,27 +37,66 @@ class VolatilityEstimator:
     Data freshness must be maintained by the runner/orchestrator.
     '''
 
+    _PARK_C = 1.0 / (4.0 * math.log(2.0)) # Parkinson variance normalizer
+    _ANN = float(12 * 24 * 365)            # 5m periods per year
+    _SHORT_N = 12                          # Candles in the short Parkinson window (1 hour)
+    _MIN_N = 12                            # Candles required for an estimate
+    _FETCH_N = 3                           # Candles requested per add_candle
+    _INTERVAL_MS = 5 * 60 * 1000           # Candle open time spacing in ms
+
+    _ohlc: np.ndarray  # (24, 4) ring buffer of [o, h, l, c] floats
+    _head: int         # Next write row in _ohlc
+    _size: int         # Number of valid rows in _ohlc
+    _last_t: int       # Open time of the newest candle, None if empty
+    _data_version: int # Bumped whenever the candle window changes
+    _vol_cache: dict   # estimator name -> (data version, vol)
+
     def __init__(self, api: BinanceAPI):
-        self.candles_5m = deque(maxlen=24)
+        self._ohlc = np.empty((24, 4), dtype=np.float64)
+        self._head = 0
+        self._size = 0
+        self._last_t = None
+        self._data_version = 0
+        self._vol_cache = {}
         self.api = api
         self.timestamp = time.time()
 
         self.periods_per_year = 12 * 24 * 365
 
+        # Compile the kernel now rather than on the first trading tick
+        rogers_kernel(np.ones((1, 4), dtype=np.float64))
+
+    @property
+    def ready(self) -> bool:
+        '''
+        True once the window holds enough candles
+        for a volatility estimate.
+        '''
+        return self._size >= self._MIN_N
+
     async def add_candle(self):
         '''
         Adds newest candle to the backing data struct.
+        Only requests the latest few candles; falls back to
+        init_candles when the window is empty or the fetched
+        candles do not reach back to the newest stored one.
         '''
-        response = await self.api.get_klines("ETH_USD", "5m")
+        response = await self.api.get_klines("ETH_USD", "5m", limit=self._FETCH_N)
         new_candles = response.get("result", {}).get("data", [])
-    
-        if not self.candles_5m:
-            self.candles_5m.append(new_candles[-1])
-        else:
-            last_time = self.candles_5m[-1]["t"]
-            for candle in new_candles:
-                if candle["t"] > last_time:
-                    self.candles_5m.append(candle)
+
+        if not new_candles:
+            return
+
+        last_time = self._last_t
+
+        # Missed more candles than were fetched, rebuild the full window
+        if last_time is None or new_candles[0]["t"] > last_time + self._INTERVAL_MS:
+            await self.init_candles()
+            return
+
+        for candle in new_candles:
+            if candle["t"] > last_time:
+                self._push(candle)
         
         self.timestamp = time.time()
     
@@ -47,8 +107,29 @@ class VolatilityEstimator:
         '''
         response = await self.api.get_klines("ETH_USD", "5m")
         new_candles = response.get("result", {}).get("data", [])
-        self.candles_5m = deque(new_candles[-24:], maxlen=24)
+        self._head = 0
+        self._size = 0
+        self._last_t = None
+        self._data_version += 1
+        for candle in new_candles[-24:]:
+            self._push(candle)
         self.timestamp = time.time()
+
+    def _push(self, candle: dict) -> None:
+        '''
+        Writes candle into the ring buffer, overwriting
+        the oldest row when full.
+        '''
+        row = self._ohlc[self._head]
+        row[0] = float(candle["o"])
+        row[1] = float(candle["h"])
+        row[2] = float(candle["l"])
+        row[3] = float(candle["c"])
+
+        self._head = (self._head + 1) % 24
+        self._size = min(self._size + 1, 24)
+        self._last_t = candle["t"]
+        self._data_version += 1
     
     def parkinson_vol_estimate(self):
         '''
@@ -56,75 +137,77 @@ class VolatilityEstimator:
         Parkinson's volatility Estimator weighted by
         time-to-present and annualized. 
         Logs warnings for low volatility.
+        Cached until the candle window changes.
         '''
+        cached = self._vol_cache.get("parkinson")
+        if cached is not None and cached[0] == self._data_version:
+            return cached[1]
 
-        candles = list(self.candles_5m)
-        
-        if len(candles) < 12:
+        if self._size < self._MIN_N:
             raise RuntimeError("Insufficient price data for volatility estimation")
-        
-        short = self._parkinson(candles[-24:])
-        
-        long = self._parkinson(candles)
+
+        short, long = self._parkinson_window(self._SHORT_N)
         
         vol = .7 * short + .3 * long
 
         if vol < .05:
             logging.warning(f"Low volatility estimate: {vol}")
 
+        self._vol_cache["parkinson"] = (self._data_version, vol)
+
         return vol
         
     def rogers_vol_estimate(self):
         '''
         Returns the realized volatility (annualized) 
         according to Rogers-Satchell volatility estimator. 
+        Cached until the candle window changes.
         '''
-        candles = list(self.candles_5m)
-        
-        if len(candles) < 12:
+        cached = self._vol_cache.get("rogers")
+        if cached is not None and cached[0] == self._data_version:
+            return cached[1]
+
+        if self._size < self._MIN_N:
             raise RuntimeError("Insufficient price data for volatility estimation")
         
-        vol = self._rogers(candles)
+        vol = self._rogers(self._ohlc[:self._size])
 
         if vol < .05:
             logging.warning(f"Low volatility estimate: {vol}")
 
+        self._vol_cache["rogers"] = (self._data_version, vol)
+
         return vol
 
-    def _parkinson(self, candles):
+    def _parkinson_window(self, short_n: int) -> tuple[float, float]:
         '''
         Returns annualized volatility according to Parkinson
-        volatility estimator.
+        volatility estimator as (short, long), where short covers
+        the newest short_n candles and long the full window.
         '''
-        highs = np.array([float(c["h"]) for c in candles])
-        lows = np.array([float(c["l"]) for c in candles])
-        log_hl = np.log(highs / lows)
-        var = np.mean(log_hl ** 2) / (4 * np.log(2))
-        vol = np.sqrt(var * self.periods_per_year)
+        candles = self._ohlc[:self._size]
+        log_hl = np.log(candles[:, 1] / candles[:, 2])
+        sq = log_hl * log_hl
 
-        return vol
+        # Newest short_n rows end just before the ring head
+        recent = (self._head - short_n + np.arange(short_n)) % 24
+
+        short = math.sqrt(sq[recent].mean() * self._PARK_C * self._ANN)
+        long = math.sqrt(sq.mean() * self._PARK_C * self._ANN)
 
-    def _rogers(self, candles):
+        return short, long
+
+    def _rogers(self, candles: np.ndarray):
         '''
         Returns annualized volatility according to Rogers-Satchell
-        volatility estimator.
-        '''        
-        rs_sum = 0
-        valid = 0
-        
-        for c in candles:
-            o, h, l, close = float(c["o"]), float(c["h"]), float(c["l"]), float(c["c"])
-            
-            if h <= l or min(o, h, l, close) <= 0:
-                continue
-            
-            rs_sum += math.log(h/close) * math.log(h/o) + math.log(l/close) * math.log(l/o)
-            valid += 1
+        volatility estimator over (N, 4) OHLC rows.
+        '''
+        rs_sum, valid = rogers_kernel(candles)
         
         if valid == 0:
             raise RuntimeError("Insufficient data for volatility estimnation")
         
         variance = rs_sum / valid
-        vol = math.sqrt(max(0, variance) * self.periods_per_year)
+        vol = math.sqrt(max(0, variance) * self._ANN)
         
-        return vol
\ No newline at end of file
+        return vol
@@ -7,6 +7,7 @@ from core.market.FixedPointDollars import MAX_PRICE, MIN_PRICE, MID_DEFAULT
 from abc import ABC, abstractmethod
 import asyncio
 import logging
+import time
 from live_trading.RiskExceptions import *
 
 if TYPE_CHECKING:
@@ -26,8 +27,9 @@ class Executor(ABC):
     Exposes two abstract event-handlers for fill and market update
     events from the Kalshi Websocket.
 
-    Utilizes an execution lock during trading and reconciliation
-    to maintain state consistency.
+    Utilizes orders, inventory, and balance locks during trading and
+    reconciliation to maintain state consistency. Locks are always
+    acquired in that order.
     
     Maintains internal inventory state through fill tracking.
     Maintains other stateful fields through periodic reconciliation
@@ -36,6 +38,13 @@ class Executor(ABC):
     Must be reconciled before start of trading.
     '''
 
+    __slots__ = ("api", "market", "session",
+                 "max_inventory", "minimum_balance", "max_inventory_dev", "max_balance_dev",
+                 "balance",
+                 "_orders_fresh_until", "_inventory_fresh_until", "inventory", "last_fill_ts",
+                 "resting_orders", "unregistered_fills",
+                 "_orders_lock", "_inventory_lock", "_balance_lock")
+
     # Composition Elements
     api:     KalshiAPI
     market:  BinaryMarket
@@ -48,7 +57,12 @@ class Executor(ABC):
     max_balance_dev: float # The maximum allowable deviation between remote and local balance
 
     # Variables
-    balance: float               # Most recent balance fetched from remote
+    balance: float               # Balance fetched from remote, adjusted locally on fills
+
+    # Freshness of local state, in monotonic time
+    _STATE_TTL = 1.0              # Seconds local orders/inventory stay authoritative after a sync
+    _orders_fresh_until: float    # resting_orders is trusted until this time
+    _inventory_fresh_until: float # inventory is trusted until this time
     inventory: int               # Current position held (net long/short on YES)
     last_fill_ts: float          # Timestamp of last fill received in POSIX (ns)
 
@@ -59,7 +73,12 @@ class Executor(ABC):
                                             # always coherent w.r.t. resting_orders
 
     # Synchronization
-    _execution_lock: asyncio.Lock # Lock held for any state reconciliation and trading action
+    _orders_lock: asyncio.Lock    # Held for order sync, placement, cancellation and trading action
+    _inventory_lock: asyncio.Lock # Held for inventory sync and position closure
+    _balance_lock: asyncio.Lock   # Held for balance sync during reconciliation
+
+    _CANCEL_ATTEMPTS = 2          # Targeted cancel attempts before a full order sync
+    _CANCEL_RETRY_DELAY = .05     # Base delay between cancel attempts (s)
 
     def __init__(self, api: KalshiAPI, market: BinaryMarket, session: KalshiAuthentication, max_inventory: int,
                  minimum_balance: float, max_inventory_dev: int, max_balance_dev: float):
@@ -76,11 +95,16 @@ class Executor(ABC):
         self.max_inventory = max_inventory
 
         self.balance = 0
+
+        self._orders_fresh_until = 0.0
+        self._inventory_fresh_until = 0.0
     
         self.resting_orders = dict()
         self.unregistered_fills = dict()
 
-        self._execution_lock = asyncio.Lock()
+        self._orders_lock = asyncio.Lock()
+        self._inventory_lock = asyncio.Lock()
+        self._balance_lock = asyncio.Lock()
 
     def calculate_transaction_cost(self, price: float, count_taken: int, count_made: int) -> float:
         '''
@@ -100,18 +124,17 @@ class Executor(ABC):
         Modifies order in-place to not exceed max inventory
         constraint based on current state.
         '''
-        is_long = (order.action == "buy" and order.side == "yes") or (order.action == "sell" and order.side == "no")
-
-        if is_long:
+        if order.is_long:
             max_delta = self.max_inventory - self.inventory
         else:
             max_delta = self.inventory + self.max_inventory
 
-        order.count = max(0, min(max_delta, order.count))
+        order.set_count(max(0, min(max_delta, order.count)))
         
     def update_inv_on_fill(self, fill: FillMsg) -> None:
         '''
-        Updates inventory according to fill message.
+        Updates inventory according to fill message and
+        adjusts the local balance by the fill's cash flow.
         Checks inventory against inventory constraint
         for violations.
 
@@ -123,6 +146,17 @@ class Executor(ABC):
 
         pre_position = self.inventory
         self.inventory = fill.post_position
+        self._inventory_fresh_until = time.monotonic() + self._STATE_TTL
+        self.api.invalidate_position_map()
+
+        # Cash flow: pay for the purchased side plus fees, and receive
+        # $1 for every yes/no pair the fill closes out
+        yes_price = float(fill.yes_price_dollars)
+        price = yes_price if fill.purchased_side == "yes" else 1 - yes_price
+        fees = self.market.fee_schedule.calculate_mixed_fees(price, 0 if fill.is_taker else fill.count,
+                                                             fill.count if fill.is_taker else 0)
+        closed_pairs = (abs(pre_position) + fill.count - abs(self.inventory)) // 2
+        self.balance += closed_pairs - price * fill.count - fees
 
         # Handles fill before order
         order_id = fill.order_id
@@ -133,10 +167,10 @@ class Executor(ABC):
         else:
             self.unregistered_fills[order_id] = self.unregistered_fills.get(order_id, 0) + fill.count
 
-        logger.info(f"Fill Received. Pre-fill Inv: {pre_position}. Post-fill inv: {self.inventory}.")
+        logger.info("Fill Received. Pre-fill Inv: %s. Post-fill inv: %s.", pre_position, self.inventory)
 
         if abs(self.inventory) > self.max_inventory:
-            logger.error(f"Inventory Limit Exceeded. Limit: {self.max_inventory}. Inventory: {self.inventory}.")
+            logger.error("Inventory Limit Exceeded. Limit: %s. Inventory: %s.", self.max_inventory, self.inventory)
             raise PositionLimitExceeded
 
     async def reconcile(self) -> None:
@@ -144,17 +178,39 @@ class Executor(ABC):
         Locks execution and reconciles orders,
         balance, and inventory with remote endpoints.
         '''
-        async with self._execution_lock:
-            await self._sync_orders()
-            await self._sync_balance()
-            await self._sync_inventory()
+        async with self._orders_lock:
+            await self._reconcile_holding_orders()
+
+    async def _reconcile_holding_orders(self) -> None:
+        '''
+        Reconciles orders, balance, and inventory with remote
+        endpoints. The caller must hold _orders_lock; used on
+        error paths that already hold it.
+
+        The three syncs hit independent endpoints and run
+        concurrently. Risk limit breaches take priority over
+        other failures when re-raised.
+        '''
+        async with self._inventory_lock, self._balance_lock:
+            results = await asyncio.gather(self._sync_orders(),
+                                           self._sync_balance(),
+                                           self._sync_inventory(),
+                                           return_exceptions=True)
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for priority in (BalanceLimitExceeded, PositionLimitExceeded, BaseException):
+            for error in errors:
+                if isinstance(error, priority):
+                    raise error
         
-        logger.info(f"Reconciled: inventory={self.inventory}, balance={self.balance}, orders={len(self.resting_orders)}")
+        logger.info("Reconciled: inventory=%s, balance=%s, orders=%s", self.inventory, self.balance, len(self.resting_orders))
         
     async def _sync_balance(self) -> None:
         '''
         Fetches balance from REST endpoint.
-        Sets balance to the response value.
+        Sets balance to the response value. Between
+        reconciliations the balance is tracked locally
+        from fills.
 
         Raises BalanceLimitExceeded if the post-reconciliation
         balance is lower than permitted.
@@ -170,15 +226,16 @@ class Executor(ABC):
         remote_balance = self.balance
 
         if self.balance < self.minimum_balance:
-            logger.error(f"Balance Limit Exceeded. Limit: {self.minimum_balance}. Balance: {self.balance}.")
+            logger.error("Balance Limit Exceeded. Limit: %s. Balance: %s.", self.minimum_balance, self.balance)
             raise BalanceLimitExceeded
 
         if abs(remote_balance - local_balance) > self.max_balance_dev:
-            logger.error(f"Balance Mismatch Error. Remote: {remote_balance}. Local: {local_balance}. Difference: {abs(remote_balance - local_balance)}")
+            logger.error("Balance Mismatch Error. Remote: %s. Local: %s. Difference: %s", remote_balance, local_balance, abs(remote_balance - local_balance))
 
     async def _sync_inventory(self) -> None:
         '''
-        Fetches position from REST endpoint.
+        Fetches the market's position from REST endpoint, uncached
+        and filtered to the market's ticker.
         Sets inventory to the response value.
 
         Raises PositionLimitExceeded if the post-reconciliation
@@ -188,15 +245,14 @@ class Executor(ABC):
         shows a greater deviation than permitted.
         '''
 
-        response = await self.api.get_positions(ticker=self.market.ticker)
+        position = await self.api.get_market_position(self.market.ticker)
+        if position is not None:
+            self.inventory = position
 
-        for position in response.get("market_positions", []):
-            if position["ticker"] == self.market.ticker:
-                contracts = position["position"]
-                self.inventory = contracts
+        self._inventory_fresh_until = time.monotonic() + self._STATE_TTL
 
         if abs(self.inventory) > self.max_inventory:
-            logger.error(f"Inventory Limit Exceeded. Limit: {self.max_inventory}. Inventory: {self.inventory}.")
+            logger.error("Inventory Limit Exceeded. Limit: %s. Inventory: %s.", self.max_inventory, self.inventory)
             raise PositionLimitExceeded
         
     async def _sync_orders(self) -> None:
@@ -204,58 +260,73 @@ class Executor(ABC):
         Fetches resting orders from the REST endpoint.
         Clears local sets and sets resting_orders to match
         the outstanding orders.
+
+        Only resting orders are requested, so executed and canceled
+        history is neither transferred nor decoded, and every page
+        of resting orders is followed.
         '''
-        response = await self.api.get_orders(ticker=self.market.ticker)
+        resting = {order["order_id"]: order["remaining_count"]
+                   async for order in self.api.iter_orders(ticker=self.market.ticker, status="resting")
+                   if order["status"] == "resting"}
 
         self.resting_orders.clear()
         self.unregistered_fills.clear()
+        self.resting_orders.update(resting)
 
-        for order in response.get("orders", []):
-            order_id = order["order_id"]
-            if order["status"] == "resting":
-                self.resting_orders[order_id] = order["remaining_count"]
+        self._orders_fresh_until = time.monotonic() + self._STATE_TTL
 
     async def _cancel_outstanding_orders(self) -> None:
         '''
-        Calls batch cancellation on the whole batch of 
-        order_ids in resting_orders. Logs failures and triggers
-        reconciliation on failure/error to prevent order tracking 
-        drift.
+        Cancels the whole batch of order_ids in resting_orders
+        through the API's cancel batching gate, so cancels from
+        concurrent executors share batch calls. Orders that fail to
+        cancel are retried with back-off before falling back to a full
+        order sync. Logs failures and triggers reconciliation on
+        failure/error to prevent order tracking drift.
+
+        Must be called with _orders_lock held.
         '''
         if self.resting_orders:
             try:
-                response = await self.api.batch_cancel_orders(list(self.resting_orders))
-                
-                for order in response["orders"]:
-                    if "error" not in order:
-                        order_id = order.get("order_id")
-                        self.resting_orders.pop(order_id, None)
-                        logger.info(f"Order cancelled. order_id: {order_id}")
+                for attempt in range(self._CANCEL_ATTEMPTS):
+                    if attempt:
+                        await asyncio.sleep(self._CANCEL_RETRY_DELAY * (1 << attempt))
+
+                    results = await asyncio.gather(*(self.api.submit_cancel(order_id) for order_id in self.resting_orders))
+                    
+                    for order in results:
+                        if "error" not in order:
+                            order_id = order.get("order_id")
+                            self.resting_orders.pop(order_id, None)
+                            logger.info("Order cancelled. order_id: %s", order_id)
+
+                    if not self.resting_orders:
+                        break
 
                 if self.resting_orders:
-                    logger.error(f"Order cancellation failed. Resting orders: {self.resting_orders}")
+                    logger.error("Order cancellation failed. Resting orders: %s", self.resting_orders)
                     await self._sync_orders()
 
             # Assumes not cleared conservatively
             except KeyError as e:
-                logger.error(f"Invalid order clear response: {e}")
-                await self.reconcile()
+                logger.error("Invalid order clear response: %s", e)
+                await self._reconcile_holding_orders()
                 return
             except AuthError as e:
-                logger.critical(f"Auth failed during order clear: {e}")
-                await self.reconcile()
+                logger.critical("Auth failed during order clear: %s", e)
+                await self._reconcile_holding_orders()
                 return
             except RateLimitError as e :
-                logger.error(f"Rate limit exceeded during order clear: {e}")
-                await self.reconcile()
+                logger.error("Rate limit exceeded during order clear: %s", e)
+                await self._reconcile_holding_orders()
                 return
             except APIError as e:
-                logger.error(f"API error during order clear: {e}")
-                await self.reconcile()
+                logger.error("API error during order clear: %s", e)
+                await self._reconcile_holding_orders()
                 return
             except Exception as e:
-                logger.error(f"Unexpected exception during order clear: {e}")
-                await self.reconcile()
+                logger.error("Unexpected exception during order clear: %s", e)
+                await self._reconcile_holding_orders()
                 return
     
     async def _close_position(self) -> None:
@@ -264,65 +335,111 @@ class Executor(ABC):
         by syncing orders, cancelling all resting orders,
         and placing a market order for entire
         position.
+
+        The order sync is skipped while local orders were synced
+        within _STATE_TTL. Inventory is always synced, since fills
+        may still be queued for the event loop.
+
+        Only _orders_lock is held while cancelling, since cancel
+        failures reconcile and take _inventory_lock themselves.
         '''
-        async with self._execution_lock:
-            await self._sync_orders()
+        async with self._orders_lock:
+            if time.monotonic() > self._orders_fresh_until:
+                await self._sync_orders()
             await self._cancel_outstanding_orders()
-            await self._sync_inventory()
 
-            if self.inventory > 0:
-                order = {
-                    "ticker": self.market.ticker,
-                    "side": "yes",
-                    "action": "sell",
-                    "count": self.inventory,
-                    "type": "market"
-                }
-
-            elif self.inventory < 0:
-                order = {
-                    "ticker": self.market.ticker,
-                    "side": "no",
-                    "action": "sell",
-                    "count": abs(self.inventory),
-                    "type": "market"
-                }
-            
-            else:
-                order = None
+            async with self._inventory_lock:
+                await self._close_inventory()
+
+    async def _close_inventory(self) -> None:
+        '''
+        Syncs inventory with the remote position and places a
+        market order for all of it.
+        Must be called with _orders_lock and _inventory_lock held.
+        '''
+        try:
+            await self._sync_inventory()
+        except PositionLimitExceeded:
+            # Inventory is already set to the remote position, flatten it anyway
+            pass
+
+        if self.inventory > 0:
+            order = {
+                "ticker": self.market.ticker,
+                "side": "yes",
+                "action": "sell",
+                "count": self.inventory,
+                "type": "market"
+            }
+
+        elif self.inventory < 0:
+            order = {
+                "ticker": self.market.ticker,
+                "side": "no",
+                "action": "sell",
+                "count": abs(self.inventory),
+                "type": "market"
+            }
+        
+        else:
+            order = None
 
-            if order:
-                await self.api.batch_create_orders([order])
+        if order:
+            await self.api.batch_create_orders([order])
 
     async def _place_batch_order(self, orders: list[Order]) -> None:
         '''
         Attempts to place the orders list and maintains the
         correctness of the resting orders and unregistered
         fills maps. Applies order constraints before placing.
+
+        Orders go through the API's order batching gate, so orders
+        from concurrent executors share batch calls.
+
+        Must be called with _orders_lock held.
         
         Logs rejection and reconciles on order rejection to
         maintain state.
+
+        Placement and tracking run shielded from cancellation. If the
+        caller is cancelled mid-flight, the placement is awaited before
+        unwinding so placed orders are never left untracked.
         '''
         self.unregistered_fills.clear()
 
         for order in orders:
             self.constrain_order(order)
 
+        placement = asyncio.ensure_future(self._apply_batch(orders))
+        try:
+            await asyncio.shield(placement)
+        except asyncio.CancelledError:
+            if not placement.done():
+                await asyncio.wait({placement})
+            raise
+
+    async def _apply_batch(self, orders: list[Order]) -> None:
+        '''
+        Submits the orders and records the placed ones in
+        resting_orders, net of fills received during placement.
+        '''
         try:
-            response = await self.api.batch_create_orders([o.to_dict() for o in orders])
+            received_orders = await asyncio.gather(*(self.api.submit_order(o.to_dict()) for o in orders))
         except OrderRejection as e:
-            logger.error(f"Order rejected. Rejection Data: {e}")
-            await self.reconcile()
+            logger.error("Order rejected. Rejection Data: %s", e)
+            await self._reconcile_holding_orders()
             return
         except Exception:
+            # Placement outcome unknown, local orders can't be trusted
+            self._orders_fresh_until = 0.0
             return
 
-        received_orders = response.get("orders", [])
         for order in received_orders:
             order_data = order.get("order", {})
             order_id = order_data.get("order_id")
             
-            logger.info(f"Order placed.  {order_data.get("action")} {order_data.get("side")}: {order_data.get("count")}@{order_data.get("yes_price_dollars")}")
+            logger.info("Order placed.  %s %s: %s@%s", order_data.get("action"), order_data.get("side"),
+                        order_data.get("count"), order_data.get("yes_price_dollars"))
 
             remaining = order_data.get("remaining_count", 0)
             unregistered = self.unregistered_fills.pop(order_id, 0)
@@ -334,10 +451,11 @@ class Executor(ABC):
     async def get_balance(self) -> float:
         '''
         Returns balance, in dollars, from
-        REST API balance endpoint.
+        REST API balance endpoint, bypassing
+        the response cache.
         '''
 
-        response = await self.api.get_balance()
+        response = await self.api.get_balance(ttl=0)
         bal_dollars = (response.get("balance", 0)) / 100
 
         return bal_dollars
@@ -9,7 +9,9 @@ import pytz
 import time
 import math
 import logging
-from core.currency_pipeline import TickerUpdate, IndexTick
+from core.market import Order
+from core.market.FixedPointDollars import MAX_PRICE, MIN_PRICE
+from live_trading.RiskExceptions import RiskLimitExceeded
 
 logger = logging.getLogger("pricing_decisions")
 
@@ -19,7 +21,6 @@ if TYPE_CHECKING:
     from core.market import BinaryMarket
     from core.client import KalshiAuthentication
     from core.market import OrderBookSnapshot
-    from core.market import Order
     from core.derivatives_pipeline import Instrument
     from core.model import BSBOModel
     from .ExecutorSnapshot import ExecutorSnapshot
@@ -36,6 +37,14 @@ class OptionsExecutor(Executor):
     Jtilizes event-conflation on high-frequency websocket ticks
     to generate trades on fresh edges.
     '''
+
+    __slots__ = ("model", "v_estimator", "min_edge",
+                 "prediction_strike", "prediction_expiry", "currency",
+                 "_expiry_s", "_log_strike",
+                 "_tick_event", "_batch_full", "_pending_ticks",
+                 "_event_task", "tick_window", "tick_batch", "fresh_data_callback",
+                 "_fresh_tick", "sim_open_orders",
+                 "_market_snapshot", "_rogers_vol", "_gen_price")
     
     model: BSBOModel
 
@@ -44,18 +53,32 @@ class OptionsExecutor(Executor):
     prediction_expiry: float # Expiry time of the binary market in POSIX (ms)
     currency: str            # Currency name in Deribit format
 
+    # Pricing invariants, fixed for the session
+    _YEAR_S = 3.156e7        # Seconds per year
+    _expiry_s: float         # prediction_expiry in POSIX (s)
+    _log_strike: float       # log(prediction_strike)
+
     # Syncronization
     _tick_event:          asyncio.Event            # Event representing pending ticks
-    _tick_processor_task: asyncio.Task | None      # Prevents repetitive tick tasks
+    _batch_full:          asyncio.Event            # Set once tick_batch ticks are pending
+    _pending_ticks:       int                      # Ticks received since the last action
+    _event_task:          asyncio.Task | None      # Single persistent event loop task, see start()
+    tick_window:          float                    # Max time a tick burst is coalesced (s)
+    tick_batch:           int                      # Pending ticks that end the window early
     fresh_data_callback: Callable                  # Returns the freshest tick data in
                                                    # the WS pipeline
 
+    # Bound methods called on every tick action
+    _market_snapshot: Callable # self.market.snapshot
+    _rogers_vol:      Callable # self.v_estimator.rogers_vol_estimate
+    _gen_price:       Callable # self._generate_price_of_market
+
     def __init__(self, kalshi_api: KalshiAPI, market: BinaryMarket, 
                  session: KalshiAuthentication, max_inventory: int, min_edge: float,
                  currency: str, strike: float, expiry_datetime: str,
                  model: BSBOModel, v_estimator: VolatilityEstimator,
                  fresh_data_callback: Callable, max_inventory_dev, max_balance_dev,
-                 minimum_balance
+                 minimum_balance, tick_window: float = .05, tick_batch: int = 32
                  ):
         
         super().__init__(kalshi_api, market, session, max_inventory, minimum_balance, max_inventory_dev, max_balance_dev)
@@ -67,16 +90,28 @@ class OptionsExecutor(Executor):
         self.prediction_expiry = self._convert_timestamp(expiry_datetime)
         self.prediction_strike = strike
 
+        self._expiry_s = self.prediction_expiry / 1000.0
+        self._log_strike = math.log(strike)
+
         self.model = model
 
         self._tick_event = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._pending_ticks = 0
         self._fresh_tick = None
-        self._tick_processor_task = None
+        self._event_task = None
+
+        self.tick_window = tick_window
+        self.tick_batch = tick_batch
 
         self.v_estimator = v_estimator
 
         self.sim_open_orders = []
 
+        self._market_snapshot = market.snapshot
+        self._rogers_vol = v_estimator.rogers_vol_estimate
+        self._gen_price = self._generate_price_of_market
+
     def _convert_timestamp(self, est_time: str) -> int:
         '''
         Converts HH:MM MM/DD/YYYY (EST) time to POSIX (ms) 
@@ -96,66 +131,125 @@ class OptionsExecutor(Executor):
 
     def on_fill(self, fill: FillMsg) -> None:
         '''
-        Updates inv and order tracking
-        according to the fill received.
+        Updates inv and order tracking according to the
+        fill received. Applied on arrival, so a tick action
+        suspended on a REST call resumes on current inventory.
+        Logs risk limit violations.
         '''
-        self.update_inv_on_fill(fill)
+        try:
+            self.update_inv_on_fill(fill)
+        except RiskLimitExceeded as e:
+            logger.error("Risk limit exceeded on fill: %r", e)
 
     def on_tick(self) -> None:
         '''
         Event handler for ticks in the underlying currency.
-        Dispatches new tick processing task if one is not running.
-        Updates freshest tick to this tick.
+        Marks a tick pending for the event loop, which acts
+        on the freshest tick.
         '''
+        self._pending_ticks += 1
+        if self._pending_ticks >= self.tick_batch:
+            self._batch_full.set()
+
         self._tick_event.set()
 
-        if self._tick_processor_task is None or self._tick_processor_task.done():
-            self._tick_processor_task = asyncio.create_task(self._tick_processor())
+    def start(self) -> None:
+        '''
+        Starts the event loop task. Must be called from the
+        running loop before fills or ticks are delivered.
+        '''
+        if self._event_task is None or self._event_task.done():
+            self._event_task = asyncio.create_task(self._event_loop())
+
+    async def stop(self) -> None:
+        '''
+        Cancels the event loop task.
+        '''
+        if self._event_task:
+            self._event_task.cancel()
+            try:
+                await self._event_task
+            except asyncio.CancelledError:
+                pass
+            self._event_task = None
 
     def parse_tick(self, tick: TickerUpdate | IndexTick) -> float:
         '''
         Returns the estimated price of the underlying asset
         based on mid price for orderbook ticks and index
-        value for index ticks.
+        value for index ticks. Both are converted at ingest.
         '''
-        if isinstance(tick, TickerUpdate):
-            mid_price = .5 * (float(tick.k) + float(tick.b))
-        else:
-            mid_price = float(tick.v)
-
-        return mid_price
+        return tick.price
     
-    async def _tick_processor(self) -> None:
+    async def _event_loop(self) -> None:
         '''
-        Waits for tick event flag (1s timeout to return). Clears tick event flag
-        and starts action iff tick event flag is set in window.
+        Tick loop. On each tick, coalesces the burst for up to
+        tick_window, or until tick_batch ticks are pending, clears
+        tick state and starts action on the freshest tick. Fills
+        are applied by on_fill as they arrive.
+
+        The task lives for the whole session and sleeps on the
+        tick event between bursts. Failed actions are logged and
+        the loop waits for the next tick.
         '''
         while True:
-            try:
-                await asyncio.wait_for(self._tick_event.wait(), timeout=1.0)
-            except asyncio.TimeoutError:
-                return
-            
+            await self._tick_event.wait()
+
+            if self._pending_ticks < self.tick_batch:
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), timeout=self.tick_window)
+                except asyncio.TimeoutError:
+                    pass
+
             self._tick_event.clear()
+            self._batch_full.clear()
+            self._pending_ticks = 0
 
-            await self.on_tick_action()
+            try:
+                await self.on_tick_action(time.time())
+            except Exception as e:
+                logger.error("Tick action failed: %r", e)
 
-    async def on_tick_action(self) -> None:
+    async def on_tick_action(self, now_s: float | None = None) -> None:
         '''
-        Acquires execution lock and begins pricing and trading logic.
+        Acquires orders lock and begins pricing and trading logic.
+        Balance reconciliation does not block pricing.
 
         Cancels all outstanding orders, captures states, and generates 
         appropriate order for tick, market, and executor state data.
+
+        now_s is the wall clock in POSIX (s) read once per tick burst
+        and shared by every time-dependent step of the action.
+
+        Returns without pricing after cancellation whenever no order
+        could result: when there are too few candles for a volatility
+        estimate, or neither book side can take an order of positive
+        size at a valid price.
         '''
+        if now_s is None:
+            now_s = time.time()
 
-        async with self._execution_lock:
+        async with self._orders_lock:
             await self._cancel_outstanding_orders()
-            if (time.time() - self.v_estimator.timestamp) >= 300:
+            if (now_s - self.v_estimator.timestamp) >= 300:
                 await self.v_estimator.add_candle()
 
+            # Nothing can be priced until the candle window fills
+            if not self.v_estimator.ready:
+                return
+
             # Grab freshest states for action
-            market_state = self.market.snapshot()
-            executor_state = self.snapshot()
+            market_state = self._market_snapshot()
+            async with self._inventory_lock:
+                executor_state = self.snapshot()
+
+            buy_count = min(10, max(0, self.max_inventory - executor_state.inventory))
+            sell_count = min(10, max(0, executor_state.inventory + self.max_inventory))
+            can_buy = buy_count > 0 and MIN_PRICE <= market_state.best_ask <= MAX_PRICE
+            can_sell = sell_count > 0 and MIN_PRICE <= market_state.best_bid <= MAX_PRICE
+
+            if not (can_buy or can_sell):
+                return
 
             recent_tick = self.fresh_data_callback()
             
@@ -163,50 +257,42 @@ class OptionsExecutor(Executor):
                 return
             
             signal_price = self.parse_tick(recent_tick)
-            volatility = self.v_estimator.rogers_vol_estimate()
+            volatility = self._rogers_vol()
 
-            true_price = self._generate_price_of_market(signal_price, volatility)
+            true_price = self._gen_price(signal_price, volatility, now_s)
 
-            logger.info(f"Price Decision. True Price: {true_price}. Market ask: {market_state.best_ask}. Market bid: {market_state.best_bid}")
+            logger.info("Price Decision. True Price: %s. Market ask: %s. Market bid: %s",
+                        true_price, market_state.best_ask, market_state.best_bid)
             
+            # Side, action and type are fixed here and count and price
+            # (an empty book side sits outside the range) were checked above
             if true_price > market_state.best_ask + self.min_edge:
-                space = max(0, self.max_inventory - executor_state.inventory)
-                count = min(10, space)
-                order = self.construct_order(
-                    action="buy",
-                    price=market_state.best_ask,
-                    count=count
-                )
+                if can_buy:
+                    order = Order.unchecked(self.market.ticker, "yes", "buy", buy_count, "limit", market_state.best_ask)
+                    await self._place_batch_order([order])
             elif true_price < market_state.best_bid - self.min_edge:
-                space = max(0, executor_state.inventory + self.max_inventory)
-                count = min(10, space)
-                order = self.construct_order(
-                    action="sell",
-                    price=market_state.best_bid,
-                    count=count
-                )
-            else:
-                order = None
-            
-            if order:
-                await self._place_batch_order([order])
+                if can_sell:
+                    order = Order.unchecked(self.market.ticker, "yes", "sell", sell_count, "limit", market_state.best_bid)
+                    await self._place_batch_order([order])
 
-    def _generate_price_of_market(self, spot: float, volatility: float) -> float:
+    def _generate_price_of_market(self, spot: float, volatility: float, now_s: float) -> float:
         '''
         Generates the true price of the prediction market
         according to the Black-Scholes Binary Option
         price model based on market strike and expiry,
         and approximate option instrument implied volatility.
 
+        now_s is the time of pricing in POSIX (s).
+
         Returns:
             True price of the prediction market
         '''
 
-        market_price = self.model.calc_option_price(
+        market_price = self.model.calc_option_price_fast(
             spot=spot,
-            strike=self.prediction_strike,
-            t_terminal=(self.prediction_expiry - (time.time() * 1000)) / (3.156e+10),
-            implied_sig=(volatility)
+            log_strike=self._log_strike,
+            t_terminal=(self._expiry_s - now_s) / self._YEAR_S,
+            implied_sig=volatility
         )
 
         return market_price
@@ -3,9 +3,12 @@ import logging
 from typing import TYPE_CHECKING, List
 from datetime import datetime
 from .OptionsExecutor import OptionsExecutor
+from core.market import Order
+from core.market.FixedPointDollars import to_ticks
+import numpy as np
 
 if TYPE_CHECKING:
-    from core.market import Order, OrderBookSnapshot, BinaryMarket
+    from core.market import OrderBook, OrderBookSnapshot, BinaryMarket
     from core.client import KalshiAPI, KalshiAuthentication, KalshiWebsocket
     from core.model import BSBOModel
 
@@ -21,10 +24,19 @@ class OptionsExecutorSimulator(OptionsExecutor):
     and fills according to Kalshi's backend documented implementation. 
     
     Open orders are checked for fills on market orderbook ticks. 
+
+    Resting order prices and directions are mirrored in parallel
+    arrays, so each tick checks every open order in one vectorized
+    comparison.
     '''
     # Simulation Variables
     sim_open_orders: List[Order]
 
+    # Parallel arrays over sim_open_orders, valid up to _rest_n
+    _rest_ticks: np.ndarray   # yes_price_dollars of each open order in ticks
+    _rest_is_long: np.ndarray # is_long of each open order
+    _rest_n: int              # Number of open orders
+
     def __init__(self, kalshi_api: KalshiAPI, market: BinaryMarket, 
                  session: KalshiAuthentication, max_inventory: int, min_edge: float, max_inventory_dev: int,
                  max_balance_dev: float, minimum_balance: float, currency: str, strike: float, 
@@ -37,7 +49,7 @@ class OptionsExecutorSimulator(OptionsExecutor):
                          max_balance_dev=max_balance_dev, max_inventory_dev=max_inventory_dev
                          )
         
-        self.sim_open_orders = []
+        self.simulate_cancel_orders()
 
         self.balance = starting_balance
 
@@ -48,18 +60,20 @@ class OptionsExecutorSimulator(OptionsExecutor):
     def _convert_timestamp(self, timestamp: str) -> int:
         '''
         Converts ISO 8601 UTC timestamp to POSIX (ms) 
-        timestamp.
+        timestamp. fromisoformat parses the "Z" suffix directly.
         '''
-        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        return int(dt.timestamp() * 1000)
+        return int(datetime.fromisoformat(timestamp).timestamp() * 1000)
 
     def on_market_update(self):
         '''
         Market update handler.
 
-        Triggers simulation of fill logic on new snapshot.
+        Triggers simulation of fill logic against the live orderbook
+        when orders are resting. Only the top of book is read, so no
+        snapshot is built.
         '''
-        self.simulate_fill_logic(self.market.snapshot())
+        if self._rest_n:
+            self.simulate_fill_logic(self.market.orderbook)
         self.on_tick()
 
     async def get_balance(self):
@@ -86,7 +100,7 @@ class OptionsExecutorSimulator(OptionsExecutor):
         '''
         Clears internal order tracking.
         '''
-        self.sim_open_orders = []
+        self.simulate_cancel_orders()
 
     # 
     # SIMULATOR FUNCTIONS
@@ -98,11 +112,11 @@ class OptionsExecutorSimulator(OptionsExecutor):
         orderbook state and internal inventory.
         '''
         if self.inventory > 0:
-            sim_fills_logger.info(f"CLOSED POSITION: {self.inventory} YES @ {self.market.orderbook.best_bid}") 
+            sim_fills_logger.info("CLOSED POSITION: %s YES @ %s", self.inventory, self.market.orderbook.best_bid)
             self.balance += float(self.market.orderbook.best_bid * abs(self.inventory))
             self.inventory = 0
         elif self.inventory < 0:
-            sim_fills_logger.info(f"CLOSED POSITION: {self.inventory} NO @ {self.market.orderbook.best_ask.complement}")  
+            sim_fills_logger.info("CLOSED POSITION: %s NO @ %s", self.inventory, self.market.orderbook.best_ask.complement)
             self.balance += float(self.market.orderbook.best_ask.complement * abs(self.inventory))
             self.inventory = 0          
 
@@ -111,25 +125,43 @@ class OptionsExecutorSimulator(OptionsExecutor):
         Clears the internal resting order state.
         '''
         self.sim_open_orders = []
+        self._rest_ticks = np.empty(16, dtype=np.int64)
+        self._rest_is_long = np.empty(16, dtype=np.bool_)
+        self._rest_n = 0
         return
+
+    def _add_resting_order(self, order: Order) -> None:
+        '''
+        Appends order to the resting order state, doubling
+        the parallel arrays when full.
+        '''
+        n = self._rest_n
+        if n == self._rest_ticks.shape[0]:
+            self._rest_ticks = np.concatenate((self._rest_ticks, np.empty(n, dtype=np.int64)))
+            self._rest_is_long = np.concatenate((self._rest_is_long, np.empty(n, dtype=np.bool_)))
+
+        self._rest_ticks[n] = to_ticks(order.yes_price_dollars)
+        self._rest_is_long[n] = order.is_long
+        self._rest_n = n + 1
+
+        self.sim_open_orders.append(order)
     
     def simulate_place_orders(self, order: List[Order]):
         '''
         Simulates internal Kalshi logic for flip sales, constrains,
         and then places and logs the order in the internal state.
         '''
-        orders = self.simulate_flip_sale(order)
-        for o in orders:
+        log_placements = sim_orders_logger.isEnabledFor(logging.INFO)
+
+        for o in self.simulate_flip_sale(order):
             self.constrain_order(o)
+            if o.count == 0:
+                continue
 
-        for o in orders:
-            if o.count != 0:
-                if o.side == "no" and o.action == "buy" or o.side == "yes" and o.action == "sell":
-                    delta = -o.count
-                    sim_orders_logger.info(f"Simulated Order Placement. {delta:+d} @ {o.yes_price_dollars}")
-                if o.side == "no" and o.action == "sell" or o.side == "yes" and o.action == "buy":
-                    sim_orders_logger.info(f"Simulated Order Placement. {o.count:+d} @ {o.yes_price_dollars}")
-                self.sim_open_orders.append(o)
+            if log_placements:
+                delta = o.count if o.is_long else -o.count
+                sim_orders_logger.info("Simulated Order Placement. %+d @ %s", delta, o.yes_price_dollars)
+            self._add_resting_order(o)
 
     def simulate_flip_sale(self, orders: List[Order]) -> List[Order]:
         '''
@@ -137,111 +169,111 @@ class OptionsExecutorSimulator(OptionsExecutor):
         and builds new orders to imitate the back-end translation
         for a flip sale. Returns the order batch with flipped orders
         if necessary.
+
+        Split orders take their price and direction from a valid
+        order and a positive count, so they skip validation.
         '''
+        ticker = self.market.ticker
+        inventory = self.inventory
+
         result = []
         for order in orders:
-            if order.action == "sell" and order.side == "yes":
+            if order.action != "sell":
+                result.append(order)
+
+            elif order.side == "yes":
                 # Selling YES (short)
-                if order.count <= self.inventory:
+                if order.count <= inventory:
                     # Can cover w inventory
                     result.append(order)
-                elif self.inventory > 0:
+                elif inventory > 0:
                     # Can't cover, need to split
-                    result.append(Order(
-                        ticker=self.market.ticker,
-                        type="limit",
-                        action="sell",
-                        side="yes",
-                        count=self.inventory,
-                        yes_price_dollars=order.yes_price_dollars
-                    ))
-                    result.append(Order(
-                        ticker=self.market.ticker,
-                        type="limit",
-                        action="buy",
-                        side="no",
-                        count=order.count - self.inventory,
-                        yes_price_dollars=order.yes_price_dollars
-                    ))
+                    result.append(Order.unchecked(ticker, "yes", "sell", inventory, "limit", order.yes_price_dollars))
+                    result.append(Order.unchecked(ticker, "no", "buy", order.count - inventory, "limit", order.yes_price_dollars))
                 else:
                     # No flip, straight buy short
-                    order.side = "no"
-                    order.action = "buy"
+                    order.set_direction("no", "buy")
                     result.append(order)
 
-            elif order.action == "sell" and order.side == "no":
+            elif order.side == "no":
                 # Selling NO (long)
-                short_position = -self.inventory
+                short_position = -inventory
                 if short_position >= order.count:
                     # Can cover
                     result.append(order)
                 elif short_position > 0:
                     # Can't cover, split
-                    result.append(Order(
-                        ticker=self.market.ticker,
-                        type="limit",
-                        action="sell",
-                        side="no",
-                        count=short_position,
-                        yes_price_dollars=order.yes_price_dollars
-                    ))
-                    result.append(Order(
-                        ticker=self.market.ticker,
-                        type="limit",
-                        action="buy",
-                        side="yes",
-                        count=order.count - short_position,
-                        yes_price_dollars=order.yes_price_dollars
-                    ))
+                    result.append(Order.unchecked(ticker, "no", "sell", short_position, "limit", order.yes_price_dollars))
+                    result.append(Order.unchecked(ticker, "yes", "buy", order.count - short_position, "limit", order.yes_price_dollars))
                 else:
                     # Straight buy
-                    order.side = "yes"
-                    order.action = "buy"
+                    order.set_direction("yes", "buy")
                     result.append(order)
             else:
                 result.append(order)
         
         return result
 
-    def simulate_fill_logic(self, snapshot: OrderBookSnapshot):
+    def simulate_fill_logic(self, snapshot: OrderBookSnapshot | OrderBook):
         '''
-        Checks resting order list against the orderbook snapshot
-        to determine whether an order would fill. Fills against
+        Checks resting order list against the orderbook snapshot, or
+        the orderbook itself, to determine whether an order would fill. Fills against
         best bid/ask and assumes no partial fills.
+
+        Fill eligibility is computed for all open orders at once over
+        the parallel arrays. Fills are then applied in placement order
+        and unfilled orders are compacted in one pass.
         '''
-        for order in self.sim_open_orders[:]:
-            is_long = (order.side == "yes") == (order.action == "buy")
+        n = self._rest_n
+        if n == 0:
+            return
+
+        rest_ticks = self._rest_ticks[:n]
+        rest_is_long = self._rest_is_long[:n]
+
+        filled_mask = np.where(rest_is_long,
+                               to_ticks(snapshot.best_ask) <= rest_ticks,
+                               to_ticks(snapshot.best_bid) >= rest_ticks)
+        filled_idx = np.flatnonzero(filled_mask)
+
+        if filled_idx.size == 0:
+            return
+
+        open_orders = self.sim_open_orders
+
+        for i in filled_idx.tolist():
+            order = open_orders[i]
+            is_long = order.is_long
+
+            count = order.count
+            delta = count if is_long else -count
             
-            if is_long and snapshot.best_ask <= order.yes_price_dollars:
-                filled = True
-            elif not is_long and snapshot.best_bid >= order.yes_price_dollars:
-                filled = True
+            if order.side == "yes":
+                cost = float(order.yes_price_dollars)
             else:
-                filled = False
+                cost = float(order.yes_price_dollars.complement)
             
-            if filled:
-                count = order.count
-                delta = count if is_long else -count
-                
-                if order.side == "yes":
-                    cost = float(order.yes_price_dollars)
-                else:
-                    cost = float(order.yes_price_dollars.complement)
-                
-                old_inventory = self.inventory
-                
-                if order.action == "buy":
-                    self.balance -= count * cost
-                    
-                    if is_long and old_inventory < 0:
-                        pairs = min(count, -old_inventory)
-                        self.balance += pairs * 1.0
-                    elif not is_long and old_inventory > 0:
-                        pairs = min(count, old_inventory)
-                        self.balance += pairs * 1.0
-                else:
-                    self.balance += count * cost
+            old_inventory = self.inventory
+            
+            if order.action == "buy":
+                self.balance -= count * cost
                 
-                self.inventory += delta
-                self.sim_open_orders.remove(order)
-                sim_fills_logger.info(f"Simulated Order Filled. {delta:+d} @ {order.yes_price_dollars}. Bal/Inv: {self.balance}/{self.inventory}")
\ No newline at end of file
+                if is_long and old_inventory < 0:
+                    pairs = min(count, -old_inventory)
+                    self.balance += pairs * 1.0
+                elif not is_long and old_inventory > 0:
+                    pairs = min(count, old_inventory)
+                    self.balance += pairs * 1.0
+            else:
+                self.balance += count * cost
+            
+            self.inventory += delta
+            sim_fills_logger.info("Simulated Order Filled. %+d @ %s. Bal/Inv: %s/%s",
+                                  delta, order.yes_price_dollars, self.balance, self.inventory)
+
+        keep = ~filled_mask
+        kept_n = n - filled_idx.size
+        self._rest_ticks[:kept_n] = rest_ticks[keep]
+        self._rest_is_long[:kept_n] = rest_is_long[keep]
+        self._rest_n = kept_n
+        self.sim_open_orders = [order for order, kept in zip(open_orders, keep.tolist()) if kept]
\ No newline at end of file
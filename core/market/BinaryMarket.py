@@ -1,7 +1,9 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
+from collections import deque
+from functools import cache
 import asyncio
-import numpy as np
+import math
 
 from .FeeSchedule import KalshiFeeSchedule
 from .PriceBuffer import PriceBuffer
@@ -11,6 +13,15 @@ from .OrderBook import OrderBook
 if TYPE_CHECKING:
     from client.KalshiWebsocketResponses import OrderBookDeltaEnvelope, OrderBookSnapshotEnvelope, OrderBookDeltaMsg, OrderBookSnapshotMsg
 
+@cache
+def _shared_fee_schedule(taker_fee_rate: float, maker_fee_rate: float) -> KalshiFeeSchedule:
+    '''
+    Returns the fee schedule shared by every market on the given
+    rates, built on first use. Fee schedules are never mutated
+    after construction, so sharing one is safe.
+    '''
+    return KalshiFeeSchedule(taker_fee_rate=taker_fee_rate, maker_fee_rate=maker_fee_rate)
+
 class BinaryMarket:
     '''
     Base class representing a single ticker Binary Market.
@@ -37,16 +48,28 @@ class BinaryMarket:
     volatility: float | None        # Volatility over price_window, None if price_window has fewer than two sequential
                                     # price samples
 
+    # Running variance over price_window, updated per sample
+    _YEAR_NS = 1e9 * 60 * 60 * 24 * 365.25 # Nanoseconds per year
+    _VAR_RESUM_RATIO = 2.0 ** -16          # Fraction of _var_peak below which _var_sum is summed exactly
+    _var_terms: deque     # (dp)^2/dt of each interval in price_window, None if dt <= 0
+    _var_sum: float       # Sum of valid terms
+    _var_n: int           # Number of valid terms
+    _var_evictions: int   # Terms evicted since _var_sum was last summed exactly
+    _var_peak: float      # Largest _var_sum since it was last summed exactly
+    _mid: tuple           # (mid_price, float(mid_price)) of the last sample
+
 
     def __init__(self, ticker: str, volatility_window: int, on_gap_callback=None, on_update_callback=None,
                  taker_fee_rate=.07, maker_fee_rate=.0175):
         
         self.orderbook = OrderBook()
-        self.fee_schedule = KalshiFeeSchedule(taker_fee_rate=taker_fee_rate, maker_fee_rate=maker_fee_rate)
+        self.fee_schedule = _shared_fee_schedule(taker_fee_rate, maker_fee_rate)
         self.price_window = PriceBuffer(max_size=volatility_window)
 
         self.volatility_window = volatility_window
         self.volatility = None
+        self._reset_variance()
+        self._mid = (None, 0.0)
         self.ticker = ticker
 
         self.on_gap_callback = on_gap_callback
@@ -73,7 +96,12 @@ class BinaryMarket:
 
             self._apply_delta(update.seq, update.msg)
         
-            self.price_window.add([self.orderbook.mid_price, update.msg.ts])
+            # Mid only changes when the top of book moves, reuse its float otherwise
+            mid = self.orderbook.mid_price
+            if mid is not self._mid[0]:
+                self._mid = (mid, float(mid))
+
+            self._add_price(self._mid[1], update.msg.ts)
         
         self.update_volatility(self.calculate_volatility())
 
@@ -98,6 +126,7 @@ class BinaryMarket:
         '''
         # Clear price window, order invariant broken
         self.price_window = PriceBuffer(max_size=self.volatility_window)
+        self._reset_variance()
 
         self.orderbook._apply_snapshot(seq_n, snapshot_msg)
     
@@ -107,35 +136,63 @@ class BinaryMarket:
         '''
         self.orderbook._apply_delta(seq_n, delta_msg)
 
+    def _reset_variance(self) -> None:
+        '''
+        Clears the running variance of the price window.
+        '''
+        self._var_terms = deque(maxlen=max(self.volatility_window - 1, 0))
+        self._var_sum = 0.0
+        self._var_n = 0
+        self._var_evictions = 0
+        self._var_peak = 0.0
+
+    def _add_price(self, price: float, ts: int) -> None:
+        '''
+        Adds a [price, timestamp (POSIX (ns))] sample to the price
+        window and updates the running variance in O(1). The term of
+        the interval leaving the window is subtracted. The sum is
+        recomputed exactly once per window of evictions, or as soon as
+        it falls far below its peak, where rounding error left by the
+        larger terms would dominate it.
+        '''
+        window = self.price_window
+        terms = self._var_terms
+
+        if len(window) and terms.maxlen:
+            prev_price, prev_ts = window[len(window) - 1]
+            delta_time = (ts - prev_ts) / self._YEAR_NS # in years
+            term = (price - prev_price) ** 2 / delta_time if delta_time > 0 else None
+
+            if len(terms) == terms.maxlen:
+                evicted = terms[0]
+                if evicted is not None:
+                    self._var_sum -= evicted
+                    self._var_n -= 1
+                self._var_evictions += 1
+
+            terms.append(term)
+            if term is not None:
+                self._var_sum += term
+                self._var_n += 1
+                self._var_peak = max(self._var_peak, self._var_sum)
+
+            if self._var_evictions >= terms.maxlen or self._var_sum < self._var_peak * self._VAR_RESUM_RATIO:
+                self._var_sum = math.fsum(t for t in terms if t is not None)
+                self._var_peak = self._var_sum
+                self._var_evictions = 0
+
+        window.add([price, ts])
+
     def calculate_volatility(self) -> float | None:
         '''
         Calculates the annualized, realized arithmetic volatility over the samples 
-        of price window. Returns None if there are fewer than two sequential
-        price samples.
+        of price window from the running variance. Returns None if there are
+        fewer than two sequential price samples.
         '''
-        variance_values = []
-    
-        size = min(len(self.price_window), self.volatility_window)
-        price_values = self.price_window.get_last_n(size)
-        
-        for i in range(1, len(price_values)):
-            # in years
-            delta_time = (price_values[i][1] - price_values[i - 1][1]) / (1e9 * 60 * 60 * 24 * 365.25)
-            
-            if delta_time <= 0:
-                continue
-            
-            curr_price = float(price_values[i][0])
-            prev_price = float(price_values[i - 1][0])
-            
-            price_return = curr_price - prev_price
-            variance_per_unit_time = (price_return ** 2) / delta_time
-            variance_values.append(variance_per_unit_time)
-        
-        if not variance_values:
+        if not self._var_n:
             return None
-        
-        return np.sqrt(np.mean(variance_values))
+
+        return math.sqrt(max(self._var_sum, 0.0) / self._var_n)
 
     def update_volatility(self, volatility: float | None) -> float | None:
         '''
@@ -1,4 +1,6 @@
 import math
+import numpy as np
+
 class KalshiFeeSchedule:
     '''
     Class representing the standard Kalshi Fee Schedule
@@ -8,10 +10,29 @@ class KalshiFeeSchedule:
     taker_fee_rate: float # Fee for trades immediately filled against resting orders
     maker_fee_rate: float # Fee for trades filled after resting on the orderbook
 
+    # Per-contract fees at each whole-cent price, indexed by cents [0, 100]
+    _taker_pc: list[float]
+    _maker_pc: list[float]
+
     def __init__(self, taker_fee_rate=.07, maker_fee_rate=.0175):
         self.taker_fee_rate = taker_fee_rate
         self.maker_fee_rate = maker_fee_rate
 
+        cents = np.arange(101) / 100
+        self._taker_pc = (np.ceil(100 * (taker_fee_rate * cents * (1 - cents))) / 100).tolist()
+        self._maker_pc = (np.ceil(100 * (maker_fee_rate * cents * (1 - cents))) / 100).tolist()
+
+    def _fees_per_contract(self, table: list[float], rate: float, price: float) -> float:
+        '''
+        Looks up the fee-per-contract at a whole-cent price, falling
+        back to the standard equation for subpenny prices.
+        '''
+        price = float(price)
+        cents = round(price * 100)
+        if 0 <= cents <= 100 and cents / 100 == price:
+            return table[cents]
+        return math.ceil(100.0 * (rate * price * (1 - price))) / 100
+
     def _calculate_fees(self, rate: float, price: float, count: int) -> float:
         '''
         Calculates fees according to standard Kalshi equation
@@ -31,7 +52,7 @@ class KalshiFeeSchedule:
         Calculates total maker fee burden for a trade executed at price with count contracts.
         '''
         return self._calculate_fees(self.maker_fee_rate, price, count)
-    
+
     def calculate_mixed_fees(self, price: float, count_made: int, count_take: int) -> float:
         '''
         Calculates total fee burden for a trade executed at price with count_made contracts
@@ -46,11 +67,11 @@ class KalshiFeeSchedule:
         Calculates the fee-per-contract for an order executed at price
         which is filled against a resting order.
         '''
-        return math.ceil(100.0 * (.07 * price * (1 - price))) / 100
+        return self._fees_per_contract(self._taker_pc, self.taker_fee_rate, price)
     
     def maker_fees_per_contract(self, price: float) -> float:
         '''
         Calculates the fee-per-contract for an order executed at price
         which is filled after resting.
         '''
-        return math.ceil(100.0 * (.0175 * price * (1 - price))) / 100
\ No newline at end of file
+        return self._fees_per_contract(self._maker_pc, self.maker_fee_rate, price)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
+from functools import lru_cache
 from typing import Union
 
 _PRECISION = Decimal('0.0001')
@@ -13,12 +14,18 @@ class FixedPointDollars(Decimal):
     Fixed-point dollar amount with 4 decimal precision (0.xxxx).
     Compatible with subpenny pricing on Kalshi.
     """
-    
+
+    __slots__ = ('_complement',)
+
+    _complement: 'FixedPointDollars | None' # Cached 1 - price, None until first requested
+
     def __new__(cls, value: Union[float, str, Decimal, 'FixedPointDollars'] = 0):
         if isinstance(value, FixedPointDollars):
             return value
         quantized = Decimal(str(value)).quantize(_PRECISION, rounding=ROUND_DOWN)
-        return super().__new__(cls, quantized)
+        self = super().__new__(cls, quantized)
+        self._complement = None
+        return self
 
     def __add__(self, other) -> 'FixedPointDollars':
         return FixedPointDollars(Decimal.__add__(self, Decimal(str(other))))
@@ -61,8 +68,12 @@ class FixedPointDollars(Decimal):
 
     @property
     def complement(self) -> 'FixedPointDollars':
-        """No-side complement (1 - price)."""
-        return FixedPointDollars(_ONE - self)
+        """No-side complement (1 - price), computed once per instance."""
+        c = self._complement
+        if c is None:
+            c = FixedPointDollars(_ONE - self)
+            self._complement = c
+        return c
 
     @property
     def is_valid(self) -> bool:
@@ -84,4 +95,28 @@ ZERO = FixedPointDollars('0')
 ONE = FixedPointDollars('1')
 MIN_PRICE = FixedPointDollars('0.01')
 MAX_PRICE = FixedPointDollars('0.99')
-MID_DEFAULT = FixedPointDollars('0.50')
\ No newline at end of file
+MID_DEFAULT = FixedPointDollars('0.50')
+
+#
+# Integer tick representation, 1 tick = 0.0001 dollars
+#
+
+TICKS_PER_DOLLAR = 10000
+
+@lru_cache(maxsize=16384)
+def to_ticks(price: Union[float, str, Decimal]) -> int:
+    '''
+    Returns price as an integer number of ticks, truncated
+    like FixedPointDollars. Prices come from a small, fixed
+    domain, so conversions are memoized.
+    '''
+    return int(FixedPointDollars(price).scaleb(4))
+
+@lru_cache(maxsize=16384)
+def from_ticks(ticks: int) -> FixedPointDollars:
+    '''
+    Returns the FixedPointDollars price for an integer
+    number of ticks. Memoized, so equal ticks return the
+    same object.
+    '''
+    return FixedPointDollars(Decimal(ticks).scaleb(-4))
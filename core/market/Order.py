@@ -1,6 +1,12 @@
 import uuid
 from .FixedPointDollars import FixedPointDollars, MAX_PRICE, MIN_PRICE
 
+def _is_long(side: str, action: str) -> bool:
+    '''
+    Returns True if an order adds YES exposure.
+    '''
+    return (action == "buy" and side == "yes") or (action == "sell" and side == "no")
+
 class Order:
     '''
     Representation of a Kalshi API Order obj.
@@ -13,6 +19,9 @@ class Order:
     type: str                            # 'limit' or 'market'
     client_order_id: str                 # Unique de-duplication ID
     yes_price_dollars: FixedPointDollars # Price in subpenny dollars
+    is_long: bool                        # True if the order adds YES exposure (buy yes or sell no),
+                                         # kept in sync with side and action by set_direction
+    _dict: dict | None                   # Cached to_dict() payload, cleared by set_count and set_direction
 
     def __init__(self, ticker: str, side: str, action: str, count: int, type: str, 
                  yes_price_dollars: FixedPointDollars):
@@ -34,9 +43,50 @@ class Order:
         self.count = count
         self.type = type
         self.yes_price_dollars = yes_price_dollars
+        self.is_long = _is_long(side, action)
 
         self.client_order_id = str(uuid.uuid4())
-    
+        self._dict = None
+
+    @classmethod
+    def unchecked(cls, ticker: str, side: str, action: str, count: int, type: str,
+                  yes_price_dollars: FixedPointDollars) -> "Order":
+        '''
+        Builds an order without input validation for hot paths
+        whose arguments are valid by construction. Externally
+        supplied arguments must use the validating constructor.
+        '''
+        order = object.__new__(cls)
+
+        order.ticker = ticker
+        order.side = side
+        order.action = action
+        order.is_long = _is_long(side, action)
+        order.count = count
+        order.type = type
+        order.yes_price_dollars = yes_price_dollars
+        order.client_order_id = str(uuid.uuid4())
+        order._dict = None
+
+        return order
+
+    def set_count(self, count: int) -> None:
+        '''
+        Sets the order size and clears the cached payload.
+        '''
+        self.count = count
+        self._dict = None
+
+    def set_direction(self, side: str, action: str) -> None:
+        '''
+        Sets side and action, updates is_long and clears
+        the cached payload.
+        '''
+        self.side = side
+        self.action = action
+        self.is_long = _is_long(side, action)
+        self._dict = None
+
     def __hash__(self):
         return hash(self.client_order_id)
 
@@ -46,7 +96,15 @@ class Order:
         return self.client_order_id == other.client_order_id
 
     def to_dict(self):
-        return {
+        '''
+        Returns the API payload for the order. Built once and
+        reused until set_count or set_direction changes it;
+        callers must not mutate it.
+        '''
+        if self._dict is not None:
+            return self._dict
+
+        self._dict = {
             "ticker": self.ticker,
             "action": self.action,
             "side": self.side,
@@ -55,3 +113,4 @@ class Order:
             "yes_price_dollars": self.yes_price_dollars.to_string(),
             "client_order_id": self.client_order_id
         }
+        return self._dict
@@ -2,12 +2,26 @@ from __future__ import annotations
 from typing import List, TYPE_CHECKING
 from decimal import Decimal
 from dataclasses import dataclass
-from .FixedPointDollars import FixedPointDollars, ZERO, ONE, MID_DEFAULT
-from sortedcontainers.sorteddict import SortedDict
+from .FixedPointDollars import FixedPointDollars, ZERO, ONE, MID_DEFAULT, TICKS_PER_DOLLAR, to_ticks, from_ticks
+from heapq import heapify, heappop, heappush
 
 if TYPE_CHECKING:
     from client.KalshiWebsocketResponses import OrderBookDeltaMsg, OrderBookSnapshotMsg
 
+def _peek_best(book: dict, heap: list, in_heap: set) -> int | None:
+    '''
+    Returns the highest price level in book, or None if book is
+    empty. Heap entries for removed levels are popped lazily.
+    '''
+    while heap:
+        ticks = -heap[0]
+        if ticks in book:
+            return ticks
+        heappop(heap)
+        in_heap.discard(ticks)
+
+    return None
+
 class OrderBook:
     '''
     Mutable orderbook updated by delta messages.
@@ -15,20 +29,38 @@ class OrderBook:
     applied.
 
     Snapshots apply in O(N) time.
+
+    Prices are held internally as integer ticks (0.0001 dollars), so
+    delta application is int arithmetic. The top of book is exposed as
+    FixedPointDollars, converted only when it changes.
+
+    Each side is a dict of price levels with a max-heap of its
+    prices. Removed levels are dropped from the heap lazily when they
+    reach the top, so the best price is an amortized O(1) peek.
     '''
 
     # Time of latest applied orderbook delta, None before a delta is received
     timestamp: int | None # POSIX (ns)
-    
+
     # bid and ask are init to min and max values respectively
-    best_bid: FixedPointDollars # Best bid price for given orderbook    
+    best_bid: FixedPointDollars # Best bid price for given orderbook
     bid_size: int   # Size of contract at best bid price
 
     best_ask: FixedPointDollars # Best ask for a given orderbook (calculated through complement)
     ask_size: int   # Size of contract at best ask price
 
-    yes_book: SortedDict[FixedPointDollars, int] # Yes side of the orderbook in [price, resting_contract] key-value pairs
-    no_book: SortedDict[FixedPointDollars, int]  # No side of the order book in [price, resting_contracts] key-value pairs.
+    yes_book: dict[int, int] # Yes side of the orderbook in [price (ticks), resting_contract] key-value pairs
+    no_book: dict[int, int]  # No side of the order book in [price (ticks), resting_contracts] key-value pairs.
+
+    # Top of book in ticks, mirrors best_bid and best_ask
+    _bid_ticks: int
+    _ask_ticks: int
+
+    # Max-heaps of -ticks over each side, may hold removed levels
+    _yes_heap: list
+    _no_heap: list
+    _yes_in_heap: set # Ticks with an entry in _yes_heap
+    _no_in_heap: set  # Ticks with an entry in _no_heap
 
     mid_price: FixedPointDollars      # Volume-weighted mid price
     bid_ask_spread: FixedPointDollars # Best bid-ask spread
@@ -40,155 +72,189 @@ class OrderBook:
         self.timestamp = None
         self.best_bid = ZERO
         self.bid_size = 0
+        self._bid_ticks = 0
 
         self.best_ask = ONE # Init to >max value for min logic
         self.ask_size = 0
-        self.yes_book = SortedDict()
-        self.no_book = SortedDict()
+        self._ask_ticks = TICKS_PER_DOLLAR
+        self.yes_book = {}
+        self.no_book = {}
+
+        self._yes_heap = []
+        self._no_heap = []
+        self._yes_in_heap = set()
+        self._no_in_heap = set()
 
         self.mid_price = MID_DEFAULT
         self.bid_ask_spread = ZERO
 
         self.seq_n = None
-    
+
     def _apply_snapshot(self, sequence_number: int, snapshot_msg: OrderBookSnapshotMsg) -> None:
         '''
         Updates all fields of OrderBook to match snapshot.
 
         Builds batch for each side of orderbook and then
-        batch updates the sorted dicts.
+        heapifies the price levels of each side.
         '''
         self.seq_n = sequence_number
-    
+
         yes_dict = {}
         for price, size in (snapshot_msg.yes_dollars or []):
-            price = FixedPointDollars(price)
-            yes_dict[price] = yes_dict.get(price, 0) + size
+            ticks = to_ticks(price)
+            yes_dict[ticks] = yes_dict.get(ticks, 0) + size
 
         no_dict = {}
         for no_bid, size in (snapshot_msg.no_dollars or []):
-            no_bid = FixedPointDollars(no_bid)
-            no_dict[no_bid] = no_dict.get(no_bid, 0) + size
+            ticks = to_ticks(no_bid)
+            no_dict[ticks] = no_dict.get(ticks, 0) + size
 
-        # Batch insert w/ order invariant
-        self.yes_book = SortedDict(yes_dict)
-        self.no_book = SortedDict(no_dict)
+        self.yes_book = yes_dict
+        self.no_book = no_dict
 
-        if self.yes_book:
-            self.best_bid = self.yes_book.keys()[-1]
-            self.bid_size = self.yes_book[self.best_bid]
-        else:
-            self.best_bid = ZERO
-            self.bid_size = 0
+        # Batch heapify w/ order invariant
+        self._yes_heap = [-ticks for ticks in yes_dict]
+        self._no_heap = [-ticks for ticks in no_dict]
+        heapify(self._yes_heap)
+        heapify(self._no_heap)
+        self._yes_in_heap = set(yes_dict)
+        self._no_in_heap = set(no_dict)
 
-        if self.no_book:
-            highest_no_bid = self.no_book.keys()[-1]
-            self.best_ask = highest_no_bid.complement
-            self.ask_size = self.no_book[highest_no_bid]
-        else:
-            self.best_ask = ONE
-            self.ask_size = 0
+        self._find_new_best_bid()
+        self._find_new_best_ask()
 
         self.timestamp = None
-        self.mid_price = self.calc_mid_price()
-        self.bid_ask_spread = self.spread() 
+        self._refresh_top(True, True)
 
     def _apply_delta(self, sequence_number: int, delta_msg: OrderBookDeltaMsg) -> None:
         '''
         Updates all fields to represent post-delta OrderBook.
+        Mid price and spread are only recomputed when the delta
+        moves the best bid or ask.
         '''
         self.seq_n = sequence_number
+        prev_bid = self._bid_ticks
+        prev_ask = self._ask_ticks
 
         delta = delta_msg.delta
-        price = FixedPointDollars(delta_msg.price_dollars)
+        ticks = to_ticks(delta_msg.price_dollars)
 
         if delta_msg.side == "yes":
-            if price in self.yes_book:
-                self.yes_book[price] += delta
+            book = self.yes_book
+            size = book.get(ticks)
+            if size is not None:
+                size += delta
 
-                if self.yes_book[price] <= 0:
-                    del self.yes_book[price]
-                    if price == self.best_bid:
+                if size <= 0:
+                    del book[ticks]
+                    if ticks == self._bid_ticks:
                         self._find_new_best_bid()
-                elif price == self.best_bid:
-                    self.bid_size = self.yes_book[price]
+                else:
+                    book[ticks] = size
+                    if ticks == self._bid_ticks:
+                        self.bid_size = size
             else:
                 if delta > 0:
-                    self.yes_book[price] = delta
-                    if price > self.best_bid:
-                        self.best_bid = price
+                    book[ticks] = delta
+                    if ticks not in self._yes_in_heap:
+                        heappush(self._yes_heap, -ticks)
+                        self._yes_in_heap.add(ticks)
+                    if ticks > self._bid_ticks:
+                        self._bid_ticks = ticks
                         self.bid_size = delta
 
         if delta_msg.side == "no":
-            if price in self.no_book:
-                self.no_book[price] += delta
+            book = self.no_book
+            ask_ticks = TICKS_PER_DOLLAR - ticks # complement
+            size = book.get(ticks)
+            if size is not None:
+                size += delta
 
-                if self.no_book[price] <= 0:
-                    del self.no_book[price]
-                    if price.complement == self.best_ask:
+                if size <= 0:
+                    del book[ticks]
+                    if ask_ticks == self._ask_ticks:
                         self._find_new_best_ask()
-                elif price.complement == self.best_ask:
-                    self.ask_size = self.no_book[price]
+                else:
+                    book[ticks] = size
+                    if ask_ticks == self._ask_ticks:
+                        self.ask_size = size
             else:
                 if delta > 0:
-                    self.no_book[price] = delta
-                    if price.complement < self.best_ask:
-                        self.best_ask = price.complement
+                    book[ticks] = delta
+                    if ticks not in self._no_in_heap:
+                        heappush(self._no_heap, -ticks)
+                        self._no_in_heap.add(ticks)
+                    if ask_ticks < self._ask_ticks:
+                        self._ask_ticks = ask_ticks
                         self.ask_size = delta
-        
+
         self.timestamp = delta_msg.ts
+
+        bid_moved = self._bid_ticks != prev_bid
+        ask_moved = self._ask_ticks != prev_ask
+        if bid_moved or ask_moved:
+            self._refresh_top(bid_moved, ask_moved)
+
+    def _refresh_top(self, bid_moved: bool, ask_moved: bool) -> None:
+        '''
+        Converts the moved side(s) of the top of book to best_bid
+        and best_ask, then updates mid_price and bid_ask_spread.
+        '''
+        if bid_moved:
+            self.best_bid = from_ticks(self._bid_ticks) if self._bid_ticks > 0 else ZERO
+        if ask_moved:
+            self.best_ask = from_ticks(self._ask_ticks) if self._ask_ticks < TICKS_PER_DOLLAR else ONE
         self.mid_price = self.calc_mid_price()
         self.bid_ask_spread = self.spread()
 
     def _find_new_best_ask(self):
         '''
-        Sets best_ask and ask_size based on book
+        Sets best ask ticks and ask_size based on book
         '''
-        if not self.no_book:
-            self.best_ask = ONE
+        highest_no_bid = _peek_best(self.no_book, self._no_heap, self._no_in_heap)
+
+        if highest_no_bid is None:
+            self._ask_ticks = TICKS_PER_DOLLAR
             self.ask_size = 0
             return
-        
-        highest_no_bid, ask_size = self.no_book.items()[-1]
 
-        self.best_ask = highest_no_bid.complement
-        self.ask_size = ask_size
+        self._ask_ticks = TICKS_PER_DOLLAR - highest_no_bid
+        self.ask_size = self.no_book[highest_no_bid]
 
     def _find_new_best_bid(self):
         '''
-        Sets best_bid and bid_size based on book
+        Sets best bid ticks and bid_size based on book
         '''
-        if not self.yes_book:
-            self.best_bid = ZERO
+        best_bid = _peek_best(self.yes_book, self._yes_heap, self._yes_in_heap)
+
+        if best_bid is None:
+            self._bid_ticks = 0
             self.bid_size = 0
             return
-        
-        best_bid, bid_size = self.yes_book.items()[-1]
-        
-        self.best_bid = best_bid
-        self.bid_size = bid_size
+
+        self._bid_ticks = best_bid
+        self.bid_size = self.yes_book[best_bid]
 
     def calc_mid_price(self) -> FixedPointDollars:
         '''
-        Returns the mid price of the orderbook.
-        Returns default mid price if one or more of 
-        the ask and bid are invalid.
+        Returns the mid price of the orderbook, truncated
+        to the tick. Returns default mid price if one or
+        more of the ask and bid are invalid.
         '''
-        has_ask = self.best_ask < ONE
-        has_bid = self.best_bid > ZERO
+        has_ask = self._ask_ticks < TICKS_PER_DOLLAR
+        has_bid = self._bid_ticks > 0
 
         if has_ask and has_bid:
-            return (self.best_bid + self.best_ask) / 2
+            return from_ticks((self._bid_ticks + self._ask_ticks) // 2)
         elif has_ask:
             return self.best_ask
         elif has_bid:
             return self.best_bid
         else:
             return MID_DEFAULT
-    
+
     def spread(self) -> FixedPointDollars:
         '''
         Returns the bid-ask spread of the orderbook
         '''
-        return (self.best_ask - self.best_bid)
-    
\ No newline at end of file
+        return from_ticks(self._ask_ticks - self._bid_ticks)
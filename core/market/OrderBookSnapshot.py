@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Tuple, List, Dict
 from .OrderBook import OrderBook
-from .FixedPointDollars import FixedPointDollars
+from .FixedPointDollars import FixedPointDollars, from_ticks
 
 @dataclass(frozen=True)
 class OrderBookSnapshot:
@@ -34,8 +34,8 @@ class OrderBookSnapshot:
         '''
         Returns snapshot of given OrderBook
         '''
-        yes_side = sorted(list(book.yes_book.items()))
-        no_side = sorted(list(book.no_book.items()))
+        yes_side = [(from_ticks(ticks), size) for ticks, size in sorted(book.yes_book.items())]
+        no_side = [(from_ticks(ticks), size) for ticks, size in sorted(book.no_book.items())]
 
         bid_size = book.bid_size
         ask_size = book.ask_size
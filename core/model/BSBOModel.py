@@ -1,17 +1,52 @@
-from scipy.stats import norm
+from numba import njit
 import math
 
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
+# Fast-math reassociation and contraction, without the no-NaN/no-inf
+# assumptions, so invalid inputs still price as NaN
+_FASTMATH = {"reassoc", "contract", "afn", "arcp", "nsz"}
+
+@njit(cache=True, fastmath=_FASTMATH)
+def bsbo_kernel(spot: float, strike: float, t_terminal: float, implied_sig: float, risk_free_rt: float) -> float:
+    '''
+    Returns the Black-Scholes Binary Option price, with the
+    normal CDF evaluated as 0.5 * erfc(-d2 / sqrt(2)).
+    '''
+    d2 = (math.log(spot / strike) + (risk_free_rt - 0.5 * implied_sig * implied_sig) * t_terminal) / (implied_sig * math.sqrt(t_terminal))
+    return math.exp(-risk_free_rt * t_terminal) * 0.5 * math.erfc(-d2 * _INV_SQRT2)
+
+@njit(cache=True, fastmath=_FASTMATH)
+def bsbo_fast_kernel(spot: float, log_strike: float, t_terminal: float, implied_sig: float) -> float:
+    '''
+    Returns the Black-Scholes Binary Option price with a zero
+    risk-free rate and a precomputed log(strike).
+    '''
+    d2 = (math.log(spot) - log_strike - 0.5 * implied_sig * implied_sig * t_terminal) / (implied_sig * math.sqrt(t_terminal))
+    return 0.5 * math.erfc(-d2 * _INV_SQRT2)
+
 class BSBOModel:
     '''
     Basic implementation of pricing for a Binary Option according to the
     Black-Scholes equation.
+
+    Pricing runs in compiled kernels, which are warmed on construction
+    so compilation is never paid on a live tick.
     '''
+
+    def __init__(self):
+        bsbo_kernel(1.0, 1.0, 1.0, 1.0, 0.0)
+        bsbo_fast_kernel(1.0, 0.0, 1.0, 1.0)
     
     def calc_option_price(self, spot: float, strike: float, t_terminal: float, implied_sig: float, risk_free_rt=0.0):
         '''
         Returns the price of an option with params based on Black-Scholes Binary Option.
         '''
-        d2 = (math.log(spot / strike) + (risk_free_rt - 0.5 * implied_sig ** 2) * t_terminal) / (implied_sig * math.sqrt(t_terminal))
-        return float(math.exp(-risk_free_rt * t_terminal) * norm.cdf(d2))
+        return bsbo_kernel(float(spot), float(strike), float(t_terminal), float(implied_sig), float(risk_free_rt))
 
-    
\ No newline at end of file
+    def calc_option_price_fast(self, spot: float, log_strike: float, t_terminal: float, implied_sig: float):
+        '''
+        Returns the price of an option with params based on Black-Scholes Binary Option,
+        with a zero risk-free rate and a precomputed log(strike).
+        '''
+        return bsbo_fast_kernel(float(spot), float(log_strike), float(t_terminal), float(implied_sig))
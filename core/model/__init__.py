@@ -1,3 +1,3 @@
 from .BSBOModel import BSBOModel
 
-__all__ = ["BSBOModel"]
\ No newline at end of file
+__all__ = ["BSBOModel"]
@@ -3,8 +3,20 @@ import logging
 from datetime import datetime
 import asyncio
 import signal
+import sys
 import os
 
+# Run on a libuv-backed loop when available; the demo falls back
+# to the default asyncio loop rather than failing to start
+try:
+    if sys.platform == "win32":
+        import winloop as event_loop_impl
+    else:
+        import uvloop as event_loop_impl
+    loop_factory = event_loop_impl.new_event_loop
+except ImportError:
+    loop_factory = None
+
 logger = logging.getLogger("runner")
 
 def setup_logging():
@@ -76,4 +88,4 @@ async def main():
             await runner.stop()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(), loop_factory=loop_factory)
\ No newline at end of file
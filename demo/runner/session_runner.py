@@ -1,4 +1,4 @@
-import json
+import orjson
 import asyncio
 from core.client import KalshiAuthentication, KalshiAPI, KalshiWebsocket
 from core.model import BSBOModel
@@ -21,8 +21,8 @@ class TradingSessionRunner:
         '''
         Safely loads config.
         '''
-        with open(path_to_config, 'r') as file:
-            data = json.load(file)
+        with open(path_to_config, 'rb') as file:
+            data = orjson.loads(file.read())
 
             self.kalshi_authentication_config = data.get("kalshi_authentication_config")
             self.kalshi_market_config = data.get("kalshi_market_config")
@@ -97,30 +97,42 @@ class TradingSessionRunner:
         await self.ks_ws.subscribe_orderbook(self.kalshi_market_config["kalshi_ticker"])
         await self.ks_api.connect()
         await self.executor.reconcile()
+        self.executor.start()
 
     async def start(self):
+        '''
+        Runs the session until shutdown, the terminal time, orderbook
+        staleness, a risk breach, or a websocket failure.
+
+        Each exit condition is its own task, so the loop only wakes
+        when one of them fires rather than polling.
+        '''
         self._build()
         self._running = True
         await self.init_and_connect()
 
-        tasks = {asyncio.create_task(self.ks_ws.run()), asyncio.create_task(self.binance_ws.run())}
+        workers = {asyncio.create_task(self.ks_ws.run()), asyncio.create_task(self.binance_ws.run())}
 
         staleness_limits = self.risk_profile["staleness_limits"]
         terminal_time = self.risk_profile["portfolio_limits"]["terminal_exit_time"]
-        start_time = time.time()
-        last_reconciliation = time.time()
+
+        shutdown = asyncio.create_task(self.shutdown_event.wait())
+        deadline = asyncio.create_task(asyncio.sleep(terminal_time))
+        stale = asyncio.create_task(self._staleness_watch(staleness_limits["maximum_orderbook_staleness"]))
+        reconciler = asyncio.create_task(self._periodic_reconcile(staleness_limits["reconciliation_period"]))
+        watchdogs = {shutdown, deadline, stale, reconciler}
 
         try:
-            while tasks:
-                done, pending = await asyncio.wait(tasks, timeout=1.0, return_when=asyncio.FIRST_COMPLETED)
+            while workers:
+                done, _ = await asyncio.wait(workers | watchdogs, return_when=asyncio.FIRST_COMPLETED)
 
                 # Check for shutdown signal FIRST
-                if self.shutdown_event.is_set():
+                if shutdown in done:
                     logger.info("Shutdown signal detected. Closing position...")
                     await self._safe_close_position()
                     break
 
-                for task in done:
+                for task in done - {deadline, stale}:
                     try:
                         task.result()
                     except RiskLimitExceeded as e:
@@ -132,39 +144,52 @@ class TradingSessionRunner:
                         await self._safe_close_position()
                         return
 
-                now = time.time()
-                await self.executor._sync_balance()
-
-                if (now - start_time) >= terminal_time:
+                if deadline in done:
                     logger.info("Terminal time reached. Closing position...")
                     await self._safe_close_position()
                     break
 
-                if time.time() >= last_reconciliation + staleness_limits["reconciliation_period"]:
-                    logger.info("Periodic reconciliation started.")
-                    try:
-                        await self.executor.reconcile()
-                    except RiskLimitExceeded as e:
-                        logger.error(f"Risk limit exceeded: {e}. Closing position.")
-                        await self._safe_close_position()
-                        return
-                    last_reconciliation = time.time()
-                    logger.info("Periodic reconciliation finished.")
-
-                if self.market.orderbook.timestamp and (time.time_ns() - self.market.orderbook.timestamp) > staleness_limits["maximum_orderbook_staleness"] * 1e9:
+                if stale in done:
                     logger.error("Orderbook staleness threshold exceeded. Closing position...")
                     await self._safe_close_position()
                     break
 
-                tasks = pending
+                workers -= done
 
         finally:
-            # Cancel any remaining websocket tasks
-            for task in tasks:
+            # Cancel any remaining websocket and watchdog tasks
+            remaining = workers | watchdogs
+            for task in remaining:
                 task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(*remaining, return_exceptions=True)
             await self.stop()  
 
+    async def _periodic_reconcile(self, period: float) -> None:
+        '''
+        Reconciles the executor with remote endpoints every
+        period seconds. Raises RiskLimitExceeded on breach.
+        '''
+        while True:
+            await asyncio.sleep(period)
+            logger.info("Periodic reconciliation started.")
+            await self.executor.reconcile()
+            logger.info("Periodic reconciliation finished.")
+
+    async def _staleness_watch(self, max_staleness: float) -> None:
+        '''
+        Returns once the orderbook has gone max_staleness seconds
+        without a delta. Sleeps until the limit could next be
+        crossed rather than polling.
+        '''
+        while True:
+            remaining = max_staleness
+            timestamp = self.market.orderbook.timestamp
+            if timestamp:
+                remaining -= (time.time_ns() - timestamp) / 1e9
+                if remaining < 0:
+                    return
+            await asyncio.sleep(remaining)
+
     async def _safe_close_position(self):
         '''
         Close position with timeout and error handling.
@@ -195,6 +220,7 @@ class TradingSessionRunner:
             except Exception as e:
                 logger.warning(f"{name} close error: {e}")
 
+        await safe_close(self.executor.stop(), "executor")
         await safe_close(self.ks_ws.close(), "ks_ws")
         await safe_close(self.binance_ws.stop(), "binance_ws")
         await safe_close(self.ks_api.close(), "ks_api")
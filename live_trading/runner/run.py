@@ -3,13 +3,22 @@ import logging
 from datetime import datetime
 import asyncio
 import signal
+import sys
 import os
 
+# Live trading always runs on a libuv-backed loop; a missing
+# dependency fails at import rather than silently degrading
+if sys.platform == "win32":
+    import winloop as event_loop_impl
+else:
+    import uvloop as event_loop_impl
+
 logger = logging.getLogger("runner")
 
 def setup_logging(runner: TradingSessionRunner):
     loggers = runner.logger_config.get("logger_list")
     console_outs = runner.logger_config.get("console_outs")
+    level = runner.logger_config.get("log_level", "INFO")
     
     os.makedirs("logs", exist_ok=True)
     
@@ -17,7 +26,7 @@ def setup_logging(runner: TradingSessionRunner):
     
     for lg in loggers:
         log = logging.getLogger(lg)
-        log.setLevel(logging.DEBUG)
+        log.setLevel(level)
         log.propagate = False 
         
         file_handler = logging.FileHandler(f"logs/{lg}_{timestamp}.log", mode="w")
@@ -72,4 +81,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(), loop_factory=event_loop_impl.new_event_loop)
\ No newline at end of file
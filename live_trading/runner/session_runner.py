@@ -96,74 +96,96 @@ class TradingSessionRunner:
         await self.vol.init_candles()
         await self.ks_api.connect()
         await self.executor.reconcile()
+        self.executor.start()
 
     async def start(self):
+        '''
+        Runs the session until the terminal time, orderbook
+        staleness, a risk breach, or a websocket failure.
 
+        Each exit condition is its own task, so the loop only wakes
+        when one of them fires rather than polling.
+        '''
         self._build()
         self._running = True
 
         await self.init_and_connect()
 
-        tasks = {asyncio.create_task(self.ks_ws.run()), asyncio.create_task(self.binance_ws.run())}
+        workers = {asyncio.create_task(self.ks_ws.run()), asyncio.create_task(self.binance_ws.run())}
 
         staleness_limits = self.risk_profile["staleness_limits"]
 
         terminal_time = self.risk_profile["portfolio_limits"]["terminal_exit_time"]
 
-        start_time = time.time()
-        last_reconciliation = time.time()
-
-        while tasks:
-            done, pending = await asyncio.wait(tasks, timeout=1.0, return_when=asyncio.FIRST_COMPLETED)
-
-            for task in done:
-                try:
-                    task.result()
-                except RiskLimitExceeded as e:
-                    logger.error(f"Risk limit exceeded: {e}. Closing position.")
+        deadline = asyncio.create_task(asyncio.sleep(terminal_time))
+        stale = asyncio.create_task(self._staleness_watch(staleness_limits["maximum_orderbook_staleness"]))
+        reconciler = asyncio.create_task(self._periodic_reconcile(staleness_limits["reconciliation_period"]))
+        watchdogs = {deadline, stale, reconciler}
+
+        try:
+            while workers:
+                done, _ = await asyncio.wait(workers | watchdogs, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done - {deadline, stale}:
+                    try:
+                        task.result()
+                    except RiskLimitExceeded as e:
+                        logger.error(f"Risk limit exceeded: {e}. Closing position.")
+                        await self.executor._close_position()
+                        logger.info(f"Position closed.")
+                        await self.stop()
+                        return
+                    except Exception as e:
+                        logger.error(f"Task error: {e}")
+                        await self.stop()
+                        return
+
+                if deadline in done:
+                    logger.info(f"Terminal time reached. Closing position...")
                     await self.executor._close_position()
                     logger.info(f"Position closed.")
                     await self.stop()
-                    break
-                except Exception as e:
-                    await self.stop()
-                    break
-
-            
-            now = time.time()
-
-            await self.executor._sync_balance()
-
-            if (now - start_time) >= terminal_time:
-                logger.info(f"Terminal time reached. Closing position...")
-                await self.executor._close_position()
-                logger.info(f"Position closed.")
-                await self.stop()
-                break
-
-            if time.time() >= last_reconciliation + staleness_limits["reconciliation_period"]:
-                logger.info(f"Periodic reconciliation started.")
-                
-                try:
-                    await self.executor.reconcile()
-                except RiskLimitExceeded as e:
-                    logger.error(f"Risk limit exceeded: {e}. Closing position.")
+                    return
+
+                if stale in done:
+                    logger.error(f"Orderbook staleness threshold exceeded. Closing position...")
                     await self.executor._close_position()
                     logger.info(f"Position closed.")
                     await self.stop()
-                    break
+                    return
 
-                last_reconciliation = time.time()
-                logger.info(f"Periodic reconciliation finished.")
+                workers -= done
 
-            if self.market.orderbook.timestamp and (time.time_ns() - self.market.orderbook.timestamp) > staleness_limits["maximum_orderbook_staleness"] * 1e9:
-                logger.error(f"Orderbook staleness threshold exceeded. Closing position...")
-                await self.executor._close_position()
-                logger.info(f"Position closed.")
-                await self.stop()
-                break
+        finally:
+            for task in watchdogs:
+                task.cancel()
+            await asyncio.gather(*watchdogs, return_exceptions=True)
 
-            tasks = pending
+    async def _periodic_reconcile(self, period: float) -> None:
+        '''
+        Reconciles the executor with remote endpoints every
+        period seconds. Raises RiskLimitExceeded on breach.
+        '''
+        while True:
+            await asyncio.sleep(period)
+            logger.info(f"Periodic reconciliation started.")
+            await self.executor.reconcile()
+            logger.info(f"Periodic reconciliation finished.")
+
+    async def _staleness_watch(self, max_staleness: float) -> None:
+        '''
+        Returns once the orderbook has gone max_staleness seconds
+        without a delta. Sleeps until the limit could next be
+        crossed rather than polling.
+        '''
+        while True:
+            remaining = max_staleness
+            timestamp = self.market.orderbook.timestamp
+            if timestamp:
+                remaining -= (time.time_ns() - timestamp) / 1e9
+                if remaining < 0:
+                    return
+            await asyncio.sleep(remaining)
 
     async def stop(self):
         '''
@@ -178,6 +200,7 @@ class TradingSessionRunner:
             task.cancel()
 
         await asyncio.gather(*tasks, return_exceptions=True)
+        await self.executor.stop()
         await self.ks_ws.close()
         await self.binance_ws.stop()
         await self.ks_api.close()
@@ -0,0 +1,80 @@
+import math
+import random
+import statistics
+import unittest
+
+from core.market import BinaryMarket
+
+def reference_variance(market: BinaryMarket) -> float | None:
+    '''
+    Mean of (dp)^2/dt over the price window as the population
+    variance about zero of dp/sqrt(dt), skipping dt <= 0.
+    '''
+    window = market.price_window
+    samples = [window[i] for i in range(len(window))]
+    returns = []
+    for (prev_price, prev_ts), (price, ts) in zip(samples, samples[1:]):
+        delta_time = (ts - prev_ts) / market._YEAR_NS
+        if delta_time > 0:
+            returns.append((price - prev_price) / math.sqrt(delta_time))
+
+    if not returns:
+        return None
+    return statistics.pvariance(returns, mu=0.0)
+
+class TestRunningVariance(unittest.TestCase):
+
+    def assert_matches_reference(self, market: BinaryMarket) -> None:
+        expected = reference_variance(market)
+        volatility = market.calculate_volatility()
+        if expected is None:
+            self.assertIsNone(volatility)
+        else:
+            self.assertAlmostEqual(volatility ** 2, expected, delta=1e-9 * expected)
+
+    def test_matches_pvariance_on_random_sequences(self):
+        rnd = random.Random(3)
+
+        for window in (2, 3, 10, 100):
+            market = BinaryMarket("T", window)
+            price = 0.5
+            ts = 1_700_000_000 * 10**9
+
+            for _ in range(1500):
+                # Adds and cancels move the mid by a tick or half tick, or leave it
+                if rnd.random() < .6:
+                    price = min(.99, max(.01, round(price + rnd.choice((-.01, -.005, .005, .01)), 4)))
+                ts += rnd.choice((0, -5, 1, 1000, 10**6, 10**9, 10**10))
+
+                market._add_price(price, ts)
+                self.assert_matches_reference(market)
+
+    def test_resum_after_large_term_leaves_window(self):
+        market = BinaryMarket("T", 50)
+        ts = 0
+
+        # One interval of 1ns makes a term many orders above the rest
+        market._add_price(.50, ts)
+        ts += 1
+        market._add_price(.60, ts)
+        for i in range(49):
+            ts += 10**9
+            market._add_price(.60 + (i % 3) * .01, ts)
+
+        # The large term was the first evicted, so only the threshold can have resummed
+        self.assertEqual(market._var_evictions, 0)
+        self.assertEqual(market._var_peak, market._var_sum)
+        self.assertEqual(market._var_sum, math.fsum(t for t in market._var_terms if t is not None))
+        self.assert_matches_reference(market)
+
+    def test_window_of_zero_returns(self):
+        market = BinaryMarket("T", 3)
+        market._add_price(.50, 0)
+        market._add_price(.60, 1)
+        for i in range(2, 6):
+            market._add_price(.60, i * 10**9)
+
+        self.assertEqual(market.calculate_volatility(), 0.0)
+
+if __name__ == "__main__":
+    unittest.main()
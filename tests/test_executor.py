@@ -0,0 +1,113 @@
+import asyncio
+import unittest
+
+from core.client import FillMsg
+from core.client.KalshiAPI import APIError
+from core.executor.Executor import Executor
+from core.market.FeeSchedule import KalshiFeeSchedule
+from live_trading.RiskExceptions import BalanceLimitExceeded
+
+class StubAPI:
+    '''
+    KalshiAPI stand-in whose cancel endpoint always fails.
+    '''
+
+    def __init__(self, position: int):
+        self.position = position
+        self.created = []
+        self.invalidated = False
+        self.balance_cents = 10000
+        self.balance_calls = 0
+
+    async def submit_cancel(self, order_id: str) -> dict:
+        raise APIError("cancel failed")
+
+    async def iter_orders(self, **kwargs):
+        yield {"order_id": "o1", "remaining_count": 3, "status": "resting"}
+
+    async def get_balance(self, ttl: float = .5) -> dict:
+        self.balance_calls += 1
+        return {"balance": self.balance_cents}
+
+    async def get_market_position(self, ticker: str) -> int:
+        return self.position
+
+    def invalidate_position_map(self) -> None:
+        self.invalidated = True
+
+    async def batch_create_orders(self, orders: list) -> dict:
+        self.created.extend(orders)
+        return {"orders": []}
+
+class StubMarket:
+    ticker = "T"
+    fee_schedule = KalshiFeeSchedule()
+
+class StubExecutor(Executor):
+    def on_fill(self, fill):
+        pass
+
+    def on_market_update(self):
+        pass
+
+class TestClosePosition(unittest.IsolatedAsyncioTestCase):
+
+    async def test_close_completes_when_cancel_fails(self):
+        api = StubAPI(position=4)
+        executor = StubExecutor(api, StubMarket(), None, max_inventory=10, minimum_balance=0,
+                                max_inventory_dev=0, max_balance_dev=1000)
+        executor.resting_orders["o1"] = 3
+
+        await asyncio.wait_for(executor._close_position(), timeout=2)
+
+        self.assertEqual(api.created, [{"ticker": "T", "side": "yes", "action": "sell",
+                                        "count": 4, "type": "market"}])
+        self.assertFalse(executor._orders_lock.locked())
+        self.assertFalse(executor._inventory_lock.locked())
+
+    async def test_close_resyncs_fresh_inventory(self):
+        api = StubAPI(position=-12)
+        executor = StubExecutor(api, StubMarket(), None, max_inventory=10, minimum_balance=0,
+                                max_inventory_dev=0, max_balance_dev=1000)
+        executor.inventory = 2
+        executor._inventory_fresh_until = float("inf")
+        executor._orders_fresh_until = float("inf")
+
+        await executor._close_position()
+
+        self.assertEqual(api.created, [{"ticker": "T", "side": "no", "action": "sell",
+                                        "count": 12, "type": "market"}])
+
+class TestFill(unittest.IsolatedAsyncioTestCase):
+
+    async def test_fill_invalidates_position_map(self):
+        api = StubAPI(position=0)
+        executor = StubExecutor(api, StubMarket(), None, max_inventory=10, minimum_balance=0,
+                                max_inventory_dev=0, max_balance_dev=1000)
+        fill = FillMsg(trade_id="t1", order_id="o1", market_ticker="T", side="yes", purchased_side="yes",
+                       yes_price_dollars=0.4, count=2, action="buy", post_position=2, ts=1)
+
+        executor.update_inv_on_fill(fill)
+
+        self.assertEqual(executor.inventory, 2)
+        self.assertTrue(api.invalidated)
+
+class TestSyncBalance(unittest.IsolatedAsyncioTestCase):
+
+    async def test_every_sync_fetches_remote_balance(self):
+        api = StubAPI(position=0)
+        executor = StubExecutor(api, StubMarket(), None, max_inventory=10, minimum_balance=50,
+                                max_inventory_dev=0, max_balance_dev=1000)
+
+        await executor._sync_balance()
+        await executor._sync_balance()
+        self.assertEqual(api.balance_calls, 2)
+        self.assertEqual(executor.balance, 100)
+
+        api.balance_cents = 4000
+        with self.assertRaises(BalanceLimitExceeded):
+            await executor._sync_balance()
+        self.assertEqual(executor.balance, 40)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+
+from core.client.KalshiAPI import KalshiAPI
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+
+    async def test_follower_survives_leader_cancel(self):
+        api = KalshiAPI(session=None)
+        calls = []
+        leader_sent = asyncio.Event()
+
+        async def send_request(method, path, params=None, json=None):
+            calls.append(path)
+            if len(calls) == 1:
+                leader_sent.set()
+                await asyncio.sleep(10)
+            return {"balance": 1}
+
+        api._send_request = send_request
+
+        leader = asyncio.create_task(api._request("GET", "/balance"))
+        await leader_sent.wait()
+        follower = asyncio.create_task(api._request("GET", "/balance"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        self.assertEqual(await asyncio.wait_for(follower, timeout=1), {"balance": 1})
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(api._inflight, {})
+
+class TestPositions(unittest.IsolatedAsyncioTestCase):
+
+    async def test_market_position_is_fetched_per_ticker(self):
+        api = KalshiAPI(session=None)
+        calls = []
+
+        async def send_request(method, path, params=None, json=None):
+            calls.append(params)
+            return {"market_positions": [{"ticker": "T", "position": -3}], "cursor": ""}
+
+        api._send_request = send_request
+
+        self.assertEqual(await api.get_market_position("T"), -3)
+        self.assertEqual(await api.get_market_position("T"), -3)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0]["ticker"], "T")
+
+    async def test_market_position_missing(self):
+        api = KalshiAPI(session=None)
+
+        async def send_request(method, path, params=None, json=None):
+            return {"market_positions": [], "cursor": ""}
+
+        api._send_request = send_request
+
+        self.assertIsNone(await api.get_market_position("T"))
+
+    async def test_invalidate_position_map(self):
+        api = KalshiAPI(session=None)
+        calls = []
+
+        async def send_request(method, path, params=None, json=None):
+            calls.append(params)
+            return {"market_positions": [{"ticker": "T", "position": len(calls)}], "cursor": ""}
+
+        api._send_request = send_request
+
+        self.assertEqual(await api.get_position_map(), {"T": 1})
+        self.assertEqual(await api.get_position_map(), {"T": 1})
+        api.invalidate_position_map()
+        self.assertEqual(await api.get_position_map(), {"T": 2})
+
+if __name__ == "__main__":
+    unittest.main()
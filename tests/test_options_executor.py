@@ -0,0 +1,70 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from core.client import FillMsg
+from core.executor.OptionsExecutor import OptionsExecutor
+from core.market import FixedPointDollars
+from core.market.FeeSchedule import KalshiFeeSchedule
+
+class StubAPI:
+    '''
+    KalshiAPI stand-in that delivers a fill while a cancel is in flight.
+    '''
+
+    def __init__(self):
+        self.executor = None
+        self.fill = None
+        self.submitted = []
+
+    async def submit_cancel(self, order_id: str) -> dict:
+        await asyncio.sleep(0)
+        self.executor.on_fill(self.fill)
+        return {"order_id": order_id}
+
+    async def submit_order(self, order: dict) -> dict:
+        self.submitted.append(order)
+        return {"order": {"order_id": "o2", "remaining_count": order["count"]}}
+
+    def invalidate_position_map(self) -> None:
+        pass
+
+class StubMarket:
+    ticker = "T"
+    fee_schedule = KalshiFeeSchedule()
+
+    def snapshot(self):
+        return SimpleNamespace(best_ask=FixedPointDollars("0.40"), best_bid=FixedPointDollars("0.38"))
+
+class StubModel:
+    def calc_option_price_fast(self, spot, log_strike, t_terminal, implied_sig):
+        return 0.9
+
+class StubEstimator:
+    timestamp = float("inf")
+    ready = True
+
+    def rogers_vol_estimate(self):
+        return .5
+
+class TestFillsDuringAction(unittest.IsolatedAsyncioTestCase):
+
+    async def test_fill_during_cancel_constrains_order(self):
+        api = StubAPI()
+        executor = OptionsExecutor(api, StubMarket(), None, max_inventory=10, min_edge=.01,
+                                   currency="ETH", strike=3000.0, expiry_datetime="17:00 01/01/2100",
+                                   model=StubModel(), v_estimator=StubEstimator(),
+                                   fresh_data_callback=lambda: SimpleNamespace(price=3000.0),
+                                   max_inventory_dev=0, max_balance_dev=1000, minimum_balance=0)
+        api.executor = executor
+        api.fill = FillMsg(trade_id="t1", order_id="o1", market_ticker="T", side="yes", purchased_side="yes",
+                           yes_price_dollars=0.4, count=3, action="buy", post_position=9, ts=1)
+        executor.resting_orders["o1"] = 3
+
+        await executor.on_tick_action()
+
+        self.assertEqual(executor.inventory, 9)
+        self.assertEqual([order["count"] for order in api.submitted], [1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import asyncio
+import unittest
+
+from core.client.OrderBatcher import BatcherConfig, OrderBatcher
+
+class RecordingSender:
+    '''
+    Batch endpoint stand-in that records each batch and echoes
+    every item back as its result. Blocks while gate is clear.
+    '''
+
+    def __init__(self):
+        self.batches = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.error = None
+
+    async def __call__(self, items: list) -> dict:
+        self.batches.append(list(items))
+        await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return {"orders": [{"item": item} for item in items]}
+
+class TestOrderBatcher(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncTearDown(self):
+        await self.batcher.close()
+
+    def make(self, **config) -> RecordingSender:
+        sender = RecordingSender()
+        self.batcher = OrderBatcher(sender, BatcherConfig(**config))
+        return sender
+
+    async def test_flushes_at_max_batch(self):
+        sender = self.make(max_batch=3, max_wait_ms=10_000)
+
+        results = await asyncio.wait_for(asyncio.gather(*(self.batcher.submit(i) for i in range(3))), timeout=1)
+
+        self.assertEqual(sender.batches, [[0, 1, 2]])
+        self.assertEqual(results, [{"item": 0}, {"item": 1}, {"item": 2}])
+
+    async def test_splits_above_max_batch(self):
+        sender = self.make(max_batch=2, max_wait_ms=10_000)
+
+        results = await asyncio.wait_for(asyncio.gather(*(self.batcher.submit(i) for i in range(4))), timeout=1)
+
+        self.assertEqual(sender.batches, [[0, 1], [2, 3]])
+        self.assertEqual([result["item"] for result in results], [0, 1, 2, 3])
+
+    async def test_flushes_after_max_wait(self):
+        sender = self.make(max_batch=10, max_wait_ms=20)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        results = await asyncio.wait_for(asyncio.gather(self.batcher.submit("a"), self.batcher.submit("b")), timeout=1)
+
+        self.assertGreaterEqual(loop.time() - start, .015)
+        self.assertEqual(sender.batches, [["a", "b"]])
+        self.assertEqual(results, [{"item": "a"}, {"item": "b"}])
+
+    async def test_full_queue_blocks_submitters(self):
+        sender = self.make(max_batch=1, max_wait_ms=0, queue_size=2)
+        sender.gate.clear()
+
+        submissions = [asyncio.create_task(self.batcher.submit(i)) for i in range(4)]
+        await asyncio.sleep(.01)
+
+        # One batch is in flight, two items fill the queue, and the last submitter waits to enqueue
+        self.assertEqual(sender.batches, [[0]])
+        self.assertTrue(self.batcher._queue.full())
+        self.assertFalse(any(task.done() for task in submissions))
+
+        sender.gate.set()
+        results = await asyncio.wait_for(asyncio.gather(*submissions), timeout=1)
+
+        self.assertEqual(sender.batches, [[0], [1], [2], [3]])
+        self.assertEqual([result["item"] for result in results], [0, 1, 2, 3])
+
+    async def test_batch_error_reaches_every_submitter(self):
+        sender = self.make(max_batch=2, max_wait_ms=10_000)
+        sender.error = RuntimeError("batch failed")
+
+        results = await asyncio.wait_for(asyncio.gather(self.batcher.submit(0), self.batcher.submit(1),
+                                                        return_exceptions=True), timeout=1)
+
+        self.assertEqual([type(result) for result in results], [RuntimeError, RuntimeError])
+
+        # The worker survives a failed batch
+        sender.error = None
+        self.assertEqual(await asyncio.wait_for(asyncio.gather(self.batcher.submit(2), self.batcher.submit(3)), timeout=1),
+                         [{"item": 2}, {"item": 3}])
+
+    async def test_missing_response_entry(self):
+        self.batcher = OrderBatcher(self.short_sender, BatcherConfig(max_batch=2, max_wait_ms=10_000))
+
+        with self.assertLogs("ks_rest", level="ERROR"):
+            results = await asyncio.wait_for(asyncio.gather(self.batcher.submit(0), self.batcher.submit(1)), timeout=1)
+
+        self.assertEqual(results, [{"item": 0}, {}])
+
+    async def short_sender(self, items: list) -> dict:
+        return {"orders": [{"item": items[0]}]}
+
+    async def test_close_cancels_pending_submissions(self):
+        sender = self.make(max_batch=1, max_wait_ms=0)
+        sender.gate.clear()
+
+        submissions = [asyncio.create_task(self.batcher.submit(i)) for i in range(2)]
+        await asyncio.sleep(.01)
+        await self.batcher.close()
+
+        results = await asyncio.gather(*submissions, return_exceptions=True)
+        self.assertTrue(all(isinstance(result, asyncio.CancelledError) for result in results))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import random
+import unittest
+
+from sortedcontainers import SortedDict
+
+from core.client.KalshiWebsocketResponses import OrderBookDeltaMsg, OrderBookSnapshotMsg
+from core.market.FixedPointDollars import ZERO, ONE, MID_DEFAULT, TICKS_PER_DOLLAR, to_ticks, from_ticks
+from core.market.OrderBook import OrderBook
+
+class ReferenceBook:
+    '''
+    Naive orderbook over SortedDict sides, rescanned on every query.
+    '''
+
+    def __init__(self):
+        self.yes = SortedDict()
+        self.no = SortedDict()
+
+    def snapshot(self, yes: list, no: list) -> None:
+        self.yes = SortedDict()
+        self.no = SortedDict()
+        for side, levels in ((self.yes, yes), (self.no, no)):
+            for price, size in levels:
+                ticks = to_ticks(price)
+                side[ticks] = side.get(ticks, 0) + size
+
+    def delta(self, side: str, price: float, delta: int) -> None:
+        book = self.yes if side == "yes" else self.no
+        ticks = to_ticks(price)
+        if ticks in book:
+            size = book[ticks] + delta
+            if size <= 0:
+                del book[ticks]
+            else:
+                book[ticks] = size
+        elif delta > 0:
+            book[ticks] = delta
+
+    def top(self) -> tuple:
+        bid_ticks, bid_size = self.yes.peekitem(-1) if self.yes else (0, 0)
+        no_ticks, ask_size = self.no.peekitem(-1) if self.no else (0, 0)
+        ask_ticks = TICKS_PER_DOLLAR - no_ticks
+
+        best_bid = from_ticks(bid_ticks) if self.yes else ZERO
+        best_ask = from_ticks(ask_ticks) if self.no else ONE
+
+        if self.yes and self.no:
+            mid = from_ticks((bid_ticks + ask_ticks) // 2)
+        elif self.no:
+            mid = best_ask
+        elif self.yes:
+            mid = best_bid
+        else:
+            mid = MID_DEFAULT
+
+        return best_bid, bid_size, best_ask, ask_size, mid, from_ticks(ask_ticks - bid_ticks)
+
+def top(book: OrderBook) -> tuple:
+    return book.best_bid, book.bid_size, book.best_ask, book.ask_size, book.mid_price, book.bid_ask_spread
+
+def snapshot_msg(yes: list, no: list) -> OrderBookSnapshotMsg:
+    return OrderBookSnapshotMsg(market_ticker="T", yes_dollars=yes, no_dollars=no)
+
+def delta_msg(side: str, price: float, delta: int, ts: int = 0) -> OrderBookDeltaMsg:
+    return OrderBookDeltaMsg(market_ticker="T", side=side, price_dollars=price, delta=delta, ts=ts)
+
+class TestOrderBook(unittest.TestCase):
+
+    def test_level_to_zero_moves_top(self):
+        book = OrderBook()
+        book._apply_snapshot(1, snapshot_msg([[0.40, 2], [0.41, 5]], [[0.50, 3]]))
+
+        book._apply_delta(2, delta_msg("yes", 0.41, -5))
+
+        self.assertEqual(book.best_bid, from_ticks(4000))
+        self.assertEqual(book.bid_size, 2)
+        self.assertNotIn(to_ticks(0.41), book.yes_book)
+
+    def test_readded_level_after_stale_heap_entry(self):
+        book = OrderBook()
+        book._apply_snapshot(1, snapshot_msg([[0.40, 2], [0.45, 1]], []))
+
+        # 0.45 is emptied below the top of a deeper heap, then re-added
+        book._apply_delta(2, delta_msg("yes", 0.47, 1))
+        book._apply_delta(3, delta_msg("yes", 0.45, -1))
+        book._apply_delta(4, delta_msg("yes", 0.45, 4))
+        book._apply_delta(5, delta_msg("yes", 0.47, -1))
+
+        self.assertEqual(book.best_bid, from_ticks(4500))
+        self.assertEqual(book.bid_size, 4)
+        self.assertEqual(len(book._yes_heap), len(book._yes_in_heap))
+
+        book._apply_delta(6, delta_msg("yes", 0.45, -4))
+        book._apply_delta(7, delta_msg("yes", 0.40, -2))
+
+        self.assertEqual(book.best_bid, ZERO)
+        self.assertEqual(book.bid_size, 0)
+        self.assertEqual(book.mid_price, MID_DEFAULT)
+
+    def test_crossing_delta(self):
+        book = OrderBook()
+        book._apply_snapshot(1, snapshot_msg([[0.40, 2]], [[0.55, 3]]))
+
+        # A no bid of 0.65 asks 0.35, below the 0.40 bid
+        book._apply_delta(2, delta_msg("no", 0.65, 1))
+
+        reference = ReferenceBook()
+        reference.snapshot([[0.40, 2]], [[0.55, 3], [0.65, 1]])
+        self.assertEqual(top(book), reference.top())
+        self.assertEqual(book.bid_ask_spread, from_ticks(-500))
+
+    def test_snapshot_resets_book(self):
+        book = OrderBook()
+        book._apply_snapshot(1, snapshot_msg([[0.40, 2], [0.60, 1]], [[0.30, 3]]))
+        book._apply_delta(2, delta_msg("yes", 0.70, 4))
+
+        book._apply_snapshot(3, snapshot_msg([[0.20, 1]], []))
+
+        self.assertEqual(book.yes_book, {to_ticks(0.20): 1})
+        self.assertEqual(book.no_book, {})
+        self.assertEqual(book.best_bid, from_ticks(2000))
+        self.assertEqual(book.best_ask, ONE)
+        self.assertEqual(book.ask_size, 0)
+        self.assertEqual(book.mid_price, from_ticks(2000))
+
+        # Levels from before the snapshot must not resurface from the heap
+        book._apply_delta(4, delta_msg("yes", 0.20, -1))
+        self.assertEqual(book.best_bid, ZERO)
+
+    def test_matches_reference_on_random_deltas(self):
+        rnd = random.Random(7)
+        prices = [cents / 100 for cents in range(1, 100)]
+
+        for _ in range(20):
+            book = OrderBook()
+            reference = ReferenceBook()
+            seq = 0
+
+            for step in range(400):
+                seq += 1
+                if step % 150 == 0:
+                    yes = [[rnd.choice(prices), rnd.randint(1, 5)] for _ in range(rnd.randint(0, 6))]
+                    no = [[rnd.choice(prices), rnd.randint(1, 5)] for _ in range(rnd.randint(0, 6))]
+                    book._apply_snapshot(seq, snapshot_msg(yes, no))
+                    reference.snapshot(yes, no)
+                else:
+                    side = rnd.choice(("yes", "no"))
+                    levels = reference.yes if side == "yes" else reference.no
+                    if levels and rnd.random() < .5:
+                        # Hit an existing level, often emptying it
+                        price = from_ticks(rnd.choice(list(levels))).to_float()
+                        delta = -rnd.randint(1, 6)
+                    else:
+                        price = rnd.choice(prices)
+                        delta = rnd.choice((-2, -1, 1, 2, 3))
+                    book._apply_delta(seq, delta_msg(side, price, delta))
+                    reference.delta(side, price, delta)
+
+                self.assertEqual(top(book), reference.top())
+                self.assertEqual(book.yes_book, dict(reference.yes))
+                self.assertEqual(book.no_book, dict(reference.no))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+import msgspec
+
+from core.client.KalshiWebsocketResponses import (ENVELOPE_DECODER, OrderBookDeltaEnvelope, OrderBookSnapshotEnvelope,
+                                                  FillEnvelope, SubscribedEnvelope, ErrorEnvelope)
+
+# 2023-11-14T22:13:20.123456Z
+_TS_NS = 1_700_000_000_123_456_000
+
+class TestEnvelopeDecoder(unittest.TestCase):
+
+    def test_snapshot(self):
+        envelope = ENVELOPE_DECODER.decode(b'{"type":"orderbook_snapshot","sid":7,"seq":1,"msg":'
+                                           b'{"market_ticker":"T","yes_dollars":[["0.40",2]],"no_dollars":[["0.50",3]]}}')
+
+        self.assertIsInstance(envelope, OrderBookSnapshotEnvelope)
+        self.assertEqual((envelope.sid, envelope.seq), (7, 1))
+        self.assertEqual(envelope.msg.yes_dollars, [["0.40", 2]])
+        self.assertEqual(envelope.msg.no_dollars, [["0.50", 3]])
+        self.assertIsNone(envelope.msg.yes)
+
+    def test_delta_with_integer_ts(self):
+        envelope = ENVELOPE_DECODER.decode(b'{"type":"orderbook_delta","sid":7,"seq":2,"msg":{"market_ticker":"T",'
+                                           b'"side":"yes","price_dollars":"0.42","delta":-4,"ts":1700000000123456000}}')
+
+        self.assertIsInstance(envelope, OrderBookDeltaEnvelope)
+        self.assertEqual(envelope.msg.side, "yes")
+        self.assertEqual(envelope.msg.price_dollars, 0.42)
+        self.assertEqual(envelope.msg.delta, -4)
+        self.assertEqual(envelope.msg.ts, _TS_NS)
+
+    def test_delta_with_iso_ts(self):
+        for ts in ("2023-11-14T22:13:20.123456Z", "2023-11-14T22:13:20.123456+00:00",
+                   "2023-11-14T17:13:20.123456-05:00", "2023-11-14T22:13:20.123456"):
+            envelope = ENVELOPE_DECODER.decode(b'{"type":"orderbook_delta","sid":7,"seq":2,"msg":{"market_ticker":"T",'
+                                               b'"side":"no","price_dollars":0.5,"delta":1,"ts":"' + ts.encode() + b'"}}')
+
+            self.assertIsInstance(envelope.msg.ts, int, ts)
+            self.assertEqual(envelope.msg.ts, _TS_NS, ts)
+
+    def test_fill(self):
+        envelope = ENVELOPE_DECODER.decode(b'{"type":"fill","sid":9,"msg":{"trade_id":"t1","order_id":"o1",'
+                                           b'"market_ticker":"T","side":"yes","purchased_side":"no",'
+                                           b'"yes_price_dollars":"0.35","count":3,"action":"buy",'
+                                           b'"post_position":-3,"ts":1700000000,"is_taker":true}}')
+
+        self.assertIsInstance(envelope, FillEnvelope)
+        self.assertEqual(envelope.msg.order_id, "o1")
+        self.assertEqual(envelope.msg.yes_price_dollars, 0.35)
+        self.assertEqual(envelope.msg.post_position, -3)
+        self.assertTrue(envelope.msg.is_taker)
+
+    def test_control_messages(self):
+        subscribed = ENVELOPE_DECODER.decode(b'{"type":"subscribed","id":3,"msg":{"channel":"orderbook_delta","sid":7}}')
+        error = ENVELOPE_DECODER.decode(b'{"type":"error","id":4,"msg":{"code":6,"msg":"Already subscribed"}}')
+
+        self.assertIsInstance(subscribed, SubscribedEnvelope)
+        self.assertEqual(subscribed.msg.sid, 7)
+        self.assertIsInstance(error, ErrorEnvelope)
+        self.assertEqual(error.msg.code, 6)
+
+    def test_unknown_type(self):
+        with self.assertRaises(msgspec.ValidationError):
+            ENVELOPE_DECODER.decode(b'{"type":"trade","sid":1,"msg":{}}')
+
+    def test_invalid_delta(self):
+        with self.assertRaises(msgspec.ValidationError):
+            ENVELOPE_DECODER.decode(b'{"type":"orderbook_delta","sid":7,"seq":2,"msg":{"market_ticker":"T",'
+                                    b'"side":"maybe","price_dollars":0.5,"delta":1,"ts":1}}')
+
+if __name__ == "__main__":
+    unittest.main()